@@ -1,5 +1,9 @@
 import numpy as np
-from geometry.factories import point, vector
+from copy import deepcopy
+from functools import lru_cache
+from geometry.batch import Batch
+from geometry.factories import aabb, point, polyline, sparse, vector
+from geometry.functions import sparse as sparse_functions
 
 
 class Geometry:
@@ -149,3 +153,213 @@ def Vector(*args, **kwargs):
     vector_instance._point = repr_point
 
     return vector_instance
+
+
+def AABB(minimum, maximum):
+    """
+    Returns an instance of an axis-aligned bounding box spanning the Points minimum and maximum.
+
+    AABB is a "Mock Class" in the same way as Point and Vector. The box takes its dimension from its corner Points, and
+    its signature from theirs, so a box can only ever be tested against Points from the same coordinate system. Both
+    corners must share a signature, and minimum must be less than or equal to maximum along every dimension. Since
+    complex numbers have no ordering, boxes are only defined for Points with real coordinates.
+
+    Once the class is created, it is instanced and its corners are set. The function then returns that instance as if
+    it were just initialized.
+    """
+    type_repr_min = str(type(minimum))
+    type_repr_max = str(type(maximum))
+
+    if type_repr_min != type_repr_max \
+            or type_repr_min[len(type_repr_min) - 7:len(type_repr_min) - 2] != 'Point' \
+            or Geometry not in minimum.__class__.__bases__ \
+            or minimum.signature != maximum.signature:
+        raise TypeError('An AABB must be defined by two Points with the same signature, got %s and %s.' %
+                        (type_repr_min, type_repr_max))
+
+    if np.any(minimum._values.imag != 0) or np.any(maximum._values.imag != 0):
+        raise ValueError('An AABB can only be defined by Points with real coordinates.')
+
+    if np.any(minimum._values.real > maximum._values.real):
+        raise ValueError('The minimum corner of an AABB must not exceed the maximum corner in any dimension.')
+
+    class_attr_dict = {}
+
+    class_attr_dict.update({'__init__': aabb.init_factory(Geometry)})
+
+    # The corners are exposed read-only, since changing them in place would skip the ordering checks above
+    class_attr_dict.update({'minimum': aabb.corner_property_factory('_minimum')})
+    class_attr_dict.update({'maximum': aabb.corner_property_factory('_maximum')})
+
+    class_attr_dict.update({'dimension': aabb.dimension_property_factory()})
+    class_attr_dict.update({'signature': aabb.signature_property_factory(minimum)})
+
+    class_attr_dict.update(aabb.operator_function_factory())
+
+    aabb_cls = type(f'{minimum.dimension}D AABB', (Geometry,), class_attr_dict)
+    aabb_instance = aabb_cls()
+    aabb_instance._minimum = deepcopy(minimum)
+    aabb_instance._maximum = deepcopy(maximum)
+
+    return aabb_instance
+
+
+@lru_cache(maxsize=128)
+def _sparse_point_class(dimension, names):
+    """
+    Returns the class for SparsePoints with a given dimension and names, creating it the first time it's needed.
+
+    Dense Points get a fresh class every time, but with tens of thousands of names the class (with its name dictionary
+    and signature) would cost far more than the handful of values a SparsePoint actually stores. So the class is built
+    once per layout and shared by every SparsePoint with that layout. The cache is bounded, so at worst a layout that
+    was pushed out of it gets a new class, which compares and hashes the same as the old one.
+    """
+    class_attr_dict = {}
+
+    # Lay out attribute names in exactly the same way as Point does, so that the signatures match
+    property_name_index = tuple(zip(names, [i + dimension - len(names) for i in range(0, len(names))]))
+
+    class_attr_dict.update({'__init__': sparse.init_factory(Geometry)})
+
+    class_attr_dict.update({'__getitem__': sparse.getitem_factory()})
+    class_attr_dict.update({'__setitem__': sparse.setitem_factory()})
+
+    class_attr_dict.update({'_names': dict(property_name_index)})
+    class_attr_dict.update({'__getattr__': sparse.getattr_factory()})
+    class_attr_dict.update({'__setattr__': sparse.setattr_factory()})
+
+    class_attr_dict.update({'dimension': sparse.point_dimension_property_factory(dimension)})
+    class_attr_dict.update({'signature': point.signature_property_factory(dimension, property_name_index)})
+
+    class_attr_dict.update(sparse.point_operator_function_factory(property_name_index))
+
+    return type(f'{dimension}D SparsePoint', (Geometry,), class_attr_dict)
+
+
+@lru_cache(maxsize=128)
+def _sparse_vector_class(point_cls):
+    """Returns the class for SparseVectors wrapping SparsePoints of class point_cls, shared the same way."""
+    # Only the layout of the point matters for the signature, so an empty instance of its class will do
+    repr_point = point_cls()
+    class_attr_dict = {}
+
+    class_attr_dict.update({'__init__': sparse.init_factory(Geometry)})
+
+    class_attr_dict.update({'__getitem__': sparse.vector_getitem_factory()})
+    class_attr_dict.update({'__setitem__': sparse.vector_setitem_factory()})
+
+    class_attr_dict.update({'__getattr__': sparse.vector_getattr_factory()})
+    class_attr_dict.update({'__setattr__': sparse.vector_setattr_factory()})
+
+    class_attr_dict.update({'dimension': sparse.vector_dimension_property_factory()})
+    class_attr_dict.update({'signature': vector.signature_property_factory(repr_point)})
+
+    class_attr_dict.update(sparse.vector_operator_function_factory())
+
+    class_attr_dict.update({'norm': sparse.norm_function_factory()})
+    class_attr_dict.update({'unit': vector.unit_function_factory()})
+
+    return type(f'{repr_point.dimension}D SparseVector', (Geometry,), class_attr_dict)
+
+
+def SparsePoint(indices=(), values=(), dimension=None, names=()):
+    """
+    Returns an instance of a point that only stores its non-zero values.
+
+    SparsePoint is a "Mock Class" like Point, meant for very high-dimensional spaces where most coordinates are zero.
+    Instead of a dense array and a property per keyword, it holds a sorted array of indices and an array of the values
+    stored at them, and named attributes are resolved through a single dictionary. Unlike Point, the class is shared by
+    every SparsePoint with the same dimension and names, so each instance only costs as much as its stored values.
+
+    names plays the same role as keyword arguments do for Point: the names are given to the last len(names) dimensions,
+    in order. The dimension defaults to the number of names. A SparsePoint therefore has exactly the same signature as
+    the dense Point with the same dimension and attribute names.
+
+    Once the class is created, it is instanced and its values are set. The function then returns that instance as if it
+    were just initialized.
+    """
+    names = tuple(names)
+
+    if dimension is None:
+        dimension = len(names)
+
+    if dimension < len(names) or dimension < 1:
+        raise ValueError('A SparsePoint needs a dimension of at least 1, and at least as large as its number of names.')
+
+    point_cls = _sparse_point_class(dimension, names)
+    point_instance = point_cls()
+
+    indices, values = sparse_functions.canonicalize(indices, values)
+
+    if len(indices) > 0 and (indices[0] < 0 or indices[-1] >= dimension):
+        raise IndexError('Indices of a SparsePoint must lie between 0 and its dimension %i.' % dimension)
+
+    point_instance._indices = indices
+    point_instance._data = values
+
+    return point_instance
+
+
+def SparseVector(*args, **kwargs):
+    """
+    Returns an instance of a vector that only stores its non-zero values.
+
+    SparseVector wraps a SparsePoint the same way Vector wraps a Point, and takes either a SparsePoint or the same
+    arguments as SparsePoint. It shares its signature with the dense Vector of the same dimension and attribute names,
+    so the two can be mixed in arithmetic, in comparisons and in the functions in geometry.functions.vector.
+    """
+    repr_point = None
+
+    if len(args) > 0:
+        arg = args[0]
+        type_repr = str(type(arg))
+        if type_repr.endswith(" SparsePoint'>") and Geometry in arg.__class__.__bases__:
+            repr_point = arg
+
+    if repr_point is None:
+        repr_point = SparsePoint(*args, **kwargs)
+
+    vector_cls = _sparse_vector_class(type(repr_point))
+    vector_instance = vector_cls()
+    vector_instance._point = repr_point
+
+    return vector_instance
+
+
+def Polyline(points):
+    """
+    Returns an instance of a polyline running through a sequence of at least two Points.
+
+    Polyline is a "Mock Class" like Point and Vector. Its vertices are kept in a single Batch, so lengths, resampling,
+    simplification and closest-point queries in geometry.functions.polyline run over contiguous storage instead of
+    looping over Points. Points can be given as a Batch or as any iterable of same-signature Points, and the polyline
+    takes its dimension from them and its signature from theirs.
+
+    Once the class is created, it is instanced and its vertices are set. The function then returns that instance as if
+    it were just initialized.
+    """
+    vertices = points if isinstance(points, Batch) else Batch.from_geometries(points)
+    type_repr = str(type(vertices._template))
+
+    if type_repr[len(type_repr) - 7:len(type_repr) - 2] != 'Point' or len(vertices) < 2:
+        raise TypeError('A Polyline must be defined by at least two Points with the same signature, got %s.' %
+                        repr(vertices))
+
+    class_attr_dict = {}
+
+    class_attr_dict.update({'__init__': polyline.init_factory(Geometry)})
+
+    class_attr_dict.update({'__getitem__': polyline.getitem_factory()})
+    class_attr_dict.update({'__len__': polyline.len_factory()})
+    class_attr_dict.update({'vertices': polyline.vertices_property_factory()})
+
+    class_attr_dict.update({'dimension': polyline.dimension_property_factory()})
+    class_attr_dict.update({'signature': polyline.signature_property_factory(vertices._template)})
+
+    class_attr_dict.update(polyline.operator_function_factory())
+
+    polyline_cls = type(f'{vertices.dimension}D Polyline', (Geometry,), class_attr_dict)
+    polyline_instance = polyline_cls()
+    polyline_instance._vertices = Batch(vertices._template, np.array(vertices.values))
+
+    return polyline_instance
@@ -0,0 +1,239 @@
+import numpy as np
+from copy import deepcopy
+from geometry.functions import sparse
+
+_signature_error_description = \
+    'Signature mismatch. The dimensions of the objects are the same, but the attribute names are ' + \
+    'different. This error is intentionally thrown to prevent operations done on objects of the same ' + \
+    'dimensionality, but in different vector spaces or coordinate systems.'
+
+_shape_error_description = \
+    'Batch storage must have shape (n, %i) to match the dimension of its template, got %s.'
+
+_broadcast_error_description = \
+    'Cannot broadcast %i rows against %i rows. Operands must have the same number of rows, or one of them a single row.'
+
+_scalar_operation_error_description = \
+    'This operation is not defined for two objects of type %s. One of the operators must be a scalar number, or an ' + \
+    'array with one scalar per row. If multiplication between two Vectors is desired, use either the inner() or ' + \
+    'outer() functions for the inner and outer products, respectively.'
+
+
+def _values_of(geometry) -> np.ndarray:
+    # Vectors wrap a Point, and Points hold the array directly. Reaching into protected members isn't pretty, but
+    # it's the only way to get at the underlying numbers without indexing one element at a time.
+    point = geometry._point if hasattr(geometry, '_point') else geometry
+
+    # Batch storage is dense, so sparse geometry is scattered into a dense row on the way in
+    if sparse.is_sparse(geometry):
+        values = np.zeros(point.dimension, dtype=complex)
+        values[point._indices] = point._data
+
+        return values
+
+    return point._values
+
+
+def _dense_type(geometry) -> str:
+    # Sparse and dense geometry with the same signature can share a Batch, which always stores the dense kind
+    return str(type(geometry)).replace(" SparsePoint'>", " Point'>").replace(" SparseVector'>", " Vector'>")
+
+
+def template(dimension, names=(), vector=False):
+    """
+    Returns a zeroed Point (or Vector) of the given dimension, with names given to the last len(names) dimensions.
+
+    This is the same layout Point gives to its keyword arguments, so any signature can be rebuilt from a dimension and a
+    tuple of names.
+    """
+    from geometry.base import Point, Vector
+
+    point = Point(*([0] * (dimension - len(names))), **{name: 0 for name in names})
+
+    return Vector(point) if vector else point
+
+
+class Batch:
+    """
+    A collection of same-signature Points or Vectors, backed by a single contiguous (n, dimension) complex array.
+
+    Creating millions of Points one by one is slow, since every one of them is its own dynamically created class. A
+    Batch keeps a single template geometry around for its signature and attribute names, and stores only the numbers
+    for every element. Signatures are checked once for the whole batch rather than once per element, which is what
+    lets operations over a Batch run as single vectorized numpy kernels.
+
+    Sparse Points and Vectors can go into a Batch alongside dense ones with the same signature, but are stored densely.
+
+    Batches are collections and not base geometries, so they intentionally do not inherit from Geometry.
+    """
+
+    def __init__(self, template, values=None):
+        # Keep our own copy of the template so that users mutating their geometry doesn't change what we hand back
+        self._template = sparse.to_dense(template) if sparse.is_sparse(template) else deepcopy(template)
+
+        if values is None:
+            values = np.empty((0, template.dimension), dtype=complex)
+
+        values = np.asarray(values, dtype=complex)
+
+        if values.ndim != 2 or values.shape[1] != template.dimension:
+            raise ValueError(_shape_error_description % (template.dimension, str(values.shape)))
+
+        self._values = values
+
+    @classmethod
+    def from_geometries(cls, geometries):
+        """Build a Batch out of an iterable of Points or Vectors that all share the same signature."""
+        geometries = list(geometries)
+
+        if len(geometries) == 0:
+            raise ValueError('A Batch needs at least one geometry to take its signature from.')
+
+        template = geometries[0]
+        values = np.empty((len(geometries), template.dimension), dtype=complex)
+
+        for i, geometry in enumerate(geometries):
+            if _dense_type(geometry) != _dense_type(template) or geometry.signature != template.signature:
+                raise TypeError(_signature_error_description)
+
+            values[i] = _values_of(geometry)
+
+        return cls(template, values)
+
+    @property
+    def dimension(self):
+        return self._template.dimension
+
+    @property
+    def signature(self):
+        # A batch has the same signature as its elements, so Batches and single geometries can be checked against each
+        # other directly.
+        return self._template.signature
+
+    @property
+    def values(self) -> np.ndarray:
+        """The underlying (n, dimension) array. This is not a copy, so writing to it writes to the Batch."""
+        return self._values
+
+    @property
+    def template(self):
+        return deepcopy(self._template)
+
+    def check(self, other):
+        """Raises a TypeError if other (a Batch or a single geometry) doesn't share this Batch's signature."""
+        if self.signature != other.signature:
+            raise TypeError(_signature_error_description)
+
+    def geometry(self, values):
+        """Returns a single geometry with this Batch's signature holding a copy of values."""
+        geometry = deepcopy(self._template)
+
+        if hasattr(geometry, '_point'):
+            geometry._point._values = np.array(values, dtype=complex)
+        else:
+            geometry._values = np.array(values, dtype=complex)
+
+        return geometry
+
+    def _vector_check(self):
+        # Arithmetic is only defined on Vectors, same as for single geometries
+        if not str(type(self._template)).endswith("Vector'>"):
+            raise TypeError('Arithmetic is only defined for Batches of Vectors, got %s.' % repr(self))
+
+    def _operand(self, other, geometry_allowed=True):
+        """
+        Turns the other side of an arithmetic operation into something that broadcasts against the (n, dimension)
+        storage: (m, dimension) values for a Batch or Vector, (m, 1) for an array with one scalar per row, or a scalar.
+        """
+        self._vector_check()
+
+        if np.isscalar(other):
+            return other
+
+        if hasattr(other, 'signature'):
+            if not geometry_allowed:
+                raise TypeError(_scalar_operation_error_description % str(type(self._template)))
+
+            # One signature check covers every row
+            self.check(other)
+
+            if isinstance(other, Batch):
+                values = other.values
+            else:
+                values = _values_of(other)[np.newaxis]
+        else:
+            values = np.asarray(other)
+
+            if values.ndim != 1:
+                raise ValueError('Expected a scalar or an array with one scalar per row, got shape %s.'
+                                 % str(values.shape))
+
+            values = values[:, np.newaxis]
+
+        if len(values) != len(self) and len(values) != 1 and len(self) != 1:
+            raise ValueError(_broadcast_error_description % (len(self), len(values)))
+
+        return values
+
+    def _result(self, values):
+        return Batch(self._template, values)
+
+    def __add__(self, other):
+        return self._result(self._values + self._operand(other))
+
+    def __radd__(self, other):
+        return self._result(self._operand(other) + self._values)
+
+    def __sub__(self, other):
+        return self._result(self._values - self._operand(other))
+
+    def __rsub__(self, other):
+        return self._result(self._operand(other) - self._values)
+
+    def __mul__(self, other):
+        # Scaling only, by one scalar or a scalar per row. Products of Vectors are inner() and outer().
+        return self._result(self._values * self._operand(other, geometry_allowed=False))
+
+    def __rmul__(self, other):
+        return self._result(self._operand(other, geometry_allowed=False) * self._values)
+
+    def __truediv__(self, other):
+        return self._result(self._values / self._operand(other, geometry_allowed=False))
+
+    def __rtruediv__(self, other):
+        return self._result(self._operand(other, geometry_allowed=False) / self._values)
+
+    def __neg__(self):
+        self._vector_check()
+
+        return self._result(-self._values)
+
+    def __invert__(self):
+        return 1.0 / self
+
+    # Keeps numpy from broadcasting its own operators over a Batch, so that array * Batch ends up in __rmul__ above
+    __array_ufunc__ = None
+
+    def __len__(self):
+        return self._values.shape[0]
+
+    def __getitem__(self, key):
+        # Integers give back a standalone geometry, anything else (slices, masks, index arrays) gives back a Batch
+        if isinstance(key, (int, np.integer)):
+            return self.geometry(self._values[key])
+
+        return Batch(self._template, self._values[key])
+
+    def __setitem__(self, key, value):
+        if hasattr(value, 'signature'):
+            self.check(value)
+            value = value.values if isinstance(value, Batch) else _values_of(value)
+
+        self._values[key] = value
+
+    def __iter__(self):
+        for i in range(0, len(self)):
+            yield self.geometry(self._values[i])
+
+    def __repr__(self):
+        return '<Batch of %i %s>' % (len(self), type(self._template).__name__)
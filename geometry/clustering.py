@@ -0,0 +1,165 @@
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from geometry.batch import Batch
+from geometry.functions import vector
+
+_cluster_count_error_description = 'Cannot find %i clusters in only %i Vectors.'
+
+_minimum_count_error_description = 'The number of clusters k must be at least 1, got %i.'
+
+
+def _squared_distances(values, centroids) -> np.ndarray:
+    # |x - c|^2 = |x|^2 + |c|^2 - 2 Re(x . c*), which turns the whole block into one matrix product
+    return np.maximum(np.sum(np.abs(values) ** 2, axis=1)[:, np.newaxis] +
+                      np.sum(np.abs(centroids) ** 2, axis=1)[np.newaxis, :] -
+                      2.0 * np.real(values @ centroids.conj().T), 0.0)
+
+
+def _assign(values, centroids, block_size=65536, n_jobs=1):
+    """Returns the index of the nearest centroid for every row of values, and the squared distance to it."""
+    starts = range(0, values.shape[0], block_size)
+
+    def assign_block(start):
+        distances = _squared_distances(values[start:start + block_size], centroids)
+        labels = np.argmin(distances, axis=1)
+
+        return labels, distances[np.arange(len(labels)), labels]
+
+    # numpy releases the GIL inside of the matrix products, so threads are enough to keep several cores busy
+    if n_jobs == 1:
+        blocks = [assign_block(start) for start in starts]
+    else:
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            blocks = list(executor.map(assign_block, starts))
+
+    if len(blocks) == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0)
+
+    return np.concatenate([b[0] for b in blocks]), np.concatenate([b[1] for b in blocks])
+
+
+def _cluster_sums(values, labels, k):
+    counts = np.bincount(labels, minlength=k)
+    sums = np.empty((k, values.shape[1]), dtype=complex)
+
+    for j in range(0, values.shape[1]):
+        sums[:, j] = np.bincount(labels, weights=values[:, j].real, minlength=k) + \
+            1j * np.bincount(labels, weights=values[:, j].imag, minlength=k)
+
+    return sums, counts
+
+
+def kmeans_plusplus(vectors, k, rng=None) -> Batch:
+    """Picks k initial centroids out of vectors with k-means++ seeding, and returns them as a Batch."""
+    batch, _ = vector._as_batch(vectors)
+    rng = np.random.default_rng() if rng is None else rng
+    values = batch.values
+
+    if k < 1:
+        raise ValueError(_minimum_count_error_description % k)
+
+    if k > len(batch):
+        raise ValueError(_cluster_count_error_description % (k, len(batch)))
+
+    chosen = [rng.integers(len(batch))]
+    closest = _squared_distances(values, values[chosen])[:, 0]
+
+    for _ in range(1, k):
+        total = np.sum(closest)
+
+        # Every point is already a centroid (e.g. duplicates), so any choice is as good as another
+        probabilities = closest / total if total > 0 else np.full(len(batch), 1.0 / len(batch))
+        chosen.append(rng.choice(len(batch), p=probabilities))
+        closest = np.minimum(closest, _squared_distances(values, values[chosen[-1:]])[:, 0])
+
+    return Batch(batch._template, values[chosen])
+
+
+def kmeans(vectors, k, max_iter=100, tol=1e-6, rng=None, block_size=65536, n_jobs=1):
+    """
+    Lloyd's k-means over a Batch of same-signature Vectors.
+
+    Returns the centroids as a Batch with the signature of the input, the cluster label of every Vector, and the
+    inertia (sum of squared distances to the nearest centroid). Distances are computed block_size rows at a time, over
+    n_jobs threads. Iteration stops when no centroid moves by more than tol.
+    """
+    batch, _ = vector._as_batch(vectors)
+    rng = np.random.default_rng() if rng is None else rng
+    values = batch.values
+
+    centroids = kmeans_plusplus(batch, k, rng).values.copy()
+
+    for _ in range(0, max_iter):
+        labels, distances = _assign(values, centroids, block_size, n_jobs)
+        sums, counts = _cluster_sums(values, labels, k)
+
+        updated = centroids.copy()
+        updated[counts > 0] = sums[counts > 0] / counts[counts > 0][:, np.newaxis]
+
+        # Empty clusters are restarted on the points that are currently worst served by their centroid
+        empty = np.flatnonzero(counts == 0)
+        if len(empty) > 0:
+            updated[empty] = values[np.argsort(distances)[::-1][:len(empty)]]
+
+        shift = np.max(np.sqrt(np.sum(np.abs(updated - centroids) ** 2, axis=1)))
+        centroids = updated
+
+        if shift <= tol:
+            break
+
+    labels, distances = _assign(values, centroids, block_size, n_jobs)
+
+    return Batch(batch._template, centroids), labels, float(np.sum(distances))
+
+
+class MiniBatchKMeans:
+    """
+    Streaming k-means for input that doesn't fit in memory, or that arrives a Batch at a time.
+
+    Every call to partial_fit moves each centroid towards the mean of the Vectors assigned to it, weighted by how
+    many Vectors that centroid has seen so far. The first Batch has to hold at least k Vectors, since it is used for
+    the k-means++ initialization.
+    """
+
+    def __init__(self, k, rng=None, block_size=65536, n_jobs=1):
+        if k < 1:
+            raise ValueError(_minimum_count_error_description % k)
+
+        self.k = k
+        self.block_size = block_size
+        self.n_jobs = n_jobs
+        self._rng = np.random.default_rng() if rng is None else rng
+        self._centroids = None
+        self._counts = np.zeros(k, dtype=np.int64)
+
+    @property
+    def centroids(self) -> Batch:
+        if self._centroids is None:
+            raise ValueError('MiniBatchKMeans has no centroids until partial_fit has been called at least once.')
+
+        return Batch(self._centroids._template, self._centroids.values.copy())
+
+    def partial_fit(self, vectors):
+        batch, _ = vector._as_batch(vectors)
+
+        if self._centroids is None:
+            self._centroids = kmeans_plusplus(batch, self.k, self._rng)
+        else:
+            self._centroids.check(batch)
+
+        centroids = self._centroids.values
+        labels, _ = _assign(batch.values, centroids, self.block_size, self.n_jobs)
+        sums, counts = _cluster_sums(batch.values, labels, self.k)
+
+        self._counts += counts
+        seen = self._counts > 0
+        centroids[seen] += (sums[seen] - counts[seen][:, np.newaxis] * centroids[seen]) / \
+            self._counts[seen][:, np.newaxis]
+
+        return self
+
+    def predict(self, vectors) -> np.ndarray:
+        batch, _ = vector._as_batch(vectors)
+        self.centroids.check(batch)
+
+        return _assign(batch.values, self._centroids.values, self.block_size, self.n_jobs)[0]
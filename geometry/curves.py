@@ -0,0 +1,170 @@
+import numpy as np
+from geometry.batch import Batch
+
+_curve_error_description = 'Unknown curve %s. Use either \'morton\' or \'hilbert\'.'
+
+_bits_error_description = \
+    'Space-filling curve keys are packed into 64 bit integers, so bits * dimension must be at most 64 ' + \
+    '(got %i bits in %i dimensions).'
+
+# Coordinates are quantized in float64, which only holds integers exactly up to 2 ** 53
+_max_bits = 53
+
+_precision_error_description = \
+    'Coordinates are quantized in double precision, so there can be at most %i bits per dimension (got %i).'
+
+
+def _default_bits(dimension) -> int:
+    bits = min(32, 64 // dimension)
+
+    if bits == 0:
+        raise ValueError(_bits_error_description % (1, dimension))
+
+    return bits
+
+
+def _bounds(values, chunk_size):
+    # Computed chunk by chunk, so a memory-mapped array never has to be read into memory all at once
+    low = np.full(values.shape[1], np.inf)
+    high = np.full(values.shape[1], -np.inf)
+
+    for start in range(0, values.shape[0], chunk_size):
+        chunk = np.real(values[start:start + chunk_size])
+        low = np.minimum(low, chunk.min(axis=0))
+        high = np.maximum(high, chunk.max(axis=0))
+
+    return low, high
+
+
+def _quantize(values, bits, bounds) -> np.ndarray:
+    """Maps the real parts of an (n, dimension) array onto a (dimension, n) grid of integers in [0, 2 ** bits)."""
+    low, high = bounds
+    extent = np.where(high > low, high - low, 1.0)
+    scaled = (np.real(values) - low) / extent * (2.0 ** bits - 1)
+
+    return np.clip(np.round(scaled), 0, 2.0 ** bits - 1).astype(np.uint64).T.copy()
+
+
+def _interleave(grid, bits) -> np.ndarray:
+    # The first axis ends up in the most significant bit of every group, the same way Hilbert keys are laid out
+    dimension = grid.shape[0]
+    keys = np.zeros(grid.shape[1], dtype=np.uint64)
+
+    for b in range(bits - 1, -1, -1):
+        for i in range(0, dimension):
+            keys = (keys << np.uint64(1)) | ((grid[i] >> np.uint64(b)) & np.uint64(1))
+
+    return keys
+
+
+def _morton_keys(values, bits, bounds) -> np.ndarray:
+    return _interleave(_quantize(values, bits, bounds), bits)
+
+
+def _hilbert_keys(values, bits, bounds) -> np.ndarray:
+    # Skilling's transpose algorithm ("Programming the Hilbert curve", 2004), run on every point at once
+    x = _quantize(values, bits, bounds)
+    dimension = x.shape[0]
+
+    q = np.uint64(1) << np.uint64(bits - 1)
+
+    # Inverse undo excess work
+    while q > 1:
+        p = q - np.uint64(1)
+
+        for i in range(0, dimension):
+            high = (x[i] & q) != 0
+            t = np.where(high, np.uint64(0), (x[0] ^ x[i]) & p)
+            x[0] ^= np.where(high, p, t)
+            x[i] ^= t
+
+        q >>= np.uint64(1)
+
+    # Gray encode
+    for i in range(1, dimension):
+        x[i] ^= x[i - 1]
+
+    t = np.zeros(x.shape[1], dtype=np.uint64)
+    q = np.uint64(1) << np.uint64(bits - 1)
+
+    while q > 1:
+        t ^= np.where((x[dimension - 1] & q) != 0, q - np.uint64(1), np.uint64(0))
+        q >>= np.uint64(1)
+
+    x ^= t
+
+    return _interleave(x, bits)
+
+
+def keys(points, curve='hilbert', bits=None, bounds=None) -> np.ndarray:
+    """
+    Returns the Morton or Hilbert key of every point in a Batch (or an (n, dimension) array) as uint64.
+
+    Coordinates are quantized to bits bits per dimension between bounds, a (low, high) pair of arrays that defaults to
+    the extent of the points themselves. Only real parts are used.
+    """
+    if curve not in ('morton', 'hilbert'):
+        raise ValueError(_curve_error_description % curve)
+
+    values = points.values if isinstance(points, Batch) else points
+    bits = _default_bits(values.shape[1]) if bits is None else bits
+
+    if bits * values.shape[1] > 64:
+        raise ValueError(_bits_error_description % (bits, values.shape[1]))
+
+    if bits > _max_bits:
+        raise ValueError(_precision_error_description % (_max_bits, bits))
+
+    bounds = _bounds(values, max(1, values.shape[0])) if bounds is None else bounds
+
+    return (_morton_keys if curve == 'morton' else _hilbert_keys)(values, bits, bounds)
+
+
+def reorder(points, curve='hilbert', bits=None, bounds=None):
+    """
+    Sorts a Batch along a space-filling curve so that points close in space end up close in memory.
+
+    Returns the reordered Batch and the permutation that produced it, so that reordered == points[permutation]. Use
+    restore() to put per-point results computed on the reordered Batch back into the original order.
+    """
+    permutation = np.argsort(keys(points, curve, bits, bounds), kind='stable')
+
+    return points[permutation], permutation
+
+
+def reorder_array(values, out, curve='hilbert', bits=None, chunk_size=1000000) -> np.ndarray:
+    """
+    Sorts an (n, dimension) array, typically a numpy.memmap, along a space-filling curve into out.
+
+    Keys are computed and rows are copied chunk_size at a time, so only the keys and the permutation are ever held in
+    memory in full. Returns the permutation, such that out == values[permutation].
+    """
+    if curve not in ('morton', 'hilbert'):
+        raise ValueError(_curve_error_description % curve)
+
+    bits = _default_bits(values.shape[1]) if bits is None else bits
+    bounds = _bounds(values, chunk_size)
+
+    curve_keys = np.concatenate([keys(values[start:start + chunk_size], curve, bits, bounds)
+                                 for start in range(0, values.shape[0], chunk_size)])
+    permutation = np.argsort(curve_keys, kind='stable')
+
+    for start in range(0, values.shape[0], chunk_size):
+        chunk = permutation[start:start + chunk_size]
+        order = np.argsort(chunk)
+
+        # Reading rows in ascending order keeps access to a memory-mapped file as sequential as possible
+        out[start:start + chunk_size][order] = values[chunk[order]]
+
+    return permutation
+
+
+def restore(results, permutation):
+    """Puts per-point results computed in reordered order back into the original order of the points."""
+    if isinstance(results, Batch):
+        return results[np.argsort(permutation)]
+
+    restored = np.empty_like(results)
+    restored[permutation] = results
+
+    return restored
@@ -0,0 +1,101 @@
+import numpy as np
+from copy import deepcopy
+
+
+def init_factory(parent_class=None) -> callable:
+    """Function factory to initialize a parent class if there is one, else return a basic __init__."""
+    if parent_class is None:
+        def init(self):
+            pass
+    else:
+        def init(self):
+            parent_class.__init__(self)
+
+    return init
+
+
+def corner_property_factory(attr) -> property:
+    """Create a read-only property to access one of the corner Points of the box, stored under attribute 'attr'"""
+
+    def property_get(self):
+        # Hand back a copy, otherwise the corner could be changed in place without going through the ordering checks
+        return deepcopy(getattr(self, attr))
+
+    prop = property(property_get)
+
+    return prop
+
+
+def dimension_property_factory() -> property:
+    def dimension_get(self):
+        return self._minimum.dimension
+
+    dimension = property(dimension_get)
+
+    return dimension
+
+
+def signature_property_factory(point) -> property:
+    """Will return a hash uniquely identifying the dimension and attributes of the geometry."""
+
+    # Tagging the hash keeps boxes from ever matching the signature of a Vector built on the same kind of Point
+    sig = hash(('AABB', tuple(dir(point)), point.signature))
+
+    def signature_get(self):
+        return sig
+
+    dimension = property(signature_get)
+
+    return dimension
+
+
+def operator_function_factory() -> dict:
+    """Defines custom functions for the operators ==, != and in, as well as __hash__ and __repr__"""
+    multifunction_dict = {}
+    type_error_description = \
+        'This operation is not defined for types %s and %s. This error can ' + \
+        'also occur if the dimensions of the objects are the same, but the attribute names are different. ' + \
+        'This is intentionally done to prevent operations done on objects of the same dimensionality, but in' + \
+        'different vector spaces or coordinate systems.'
+
+    def rep(self):
+        return '[%s, %s]' % (repr(self._minimum), repr(self._maximum))
+
+    multifunction_dict.update({'__repr__': rep})
+
+    def hsh(self):
+        return hash((self._minimum.__hash__(), self._maximum.__hash__(), self.signature))
+
+    multifunction_dict.update({'__hash__': hsh})
+
+    def directory(self):
+        return dir(self._minimum)
+
+    multifunction_dict.update({'__dir__': directory})
+
+    def eq(self, other):
+        if str(type(other)) != str(type(self)) or self.signature != other.signature:
+            raise TypeError(type_error_description % (str(type(self)), str(type(other))))
+
+        return self._minimum == other._minimum and self._maximum == other._maximum
+
+    multifunction_dict.update({'__eq__': eq})
+
+    def ne(self, other):
+        return not self.__eq__(other)
+
+    multifunction_dict.update({'__ne__': ne})
+
+    def contains(self, point):
+        # Only single Points make sense for the `in` operator, since it has to return a plain bool. Batches should go
+        # through geometry.functions.aabb.contains instead.
+        if self._minimum.signature != point.signature or str(type(point)) != str(type(self._minimum)):
+            raise TypeError(type_error_description % (str(type(self)), str(type(point))))
+
+        values = point._values.real
+
+        return bool(np.all(values >= self._minimum._values.real) and np.all(values <= self._maximum._values.real))
+
+    multifunction_dict.update({'__contains__': contains})
+
+    return multifunction_dict
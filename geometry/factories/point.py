@@ -1,4 +1,5 @@
 import numpy as np
+from geometry.functions import sparse
 
 
 def init_factory(parent_class=None) -> callable:
@@ -89,7 +90,7 @@ def operator_function_factory(property_indices) -> dict:
 
     def hsh(self):
         # TODO: Define a better way of dealing with floating point imprecision than just rounding off at 8 decimals
-        return hash((tuple(np.round(val, 8) for val in self._values), property_indices))
+        return sparse.hash_values(len(self._values), range(0, len(self._values)), self._values, property_indices)
 
     multifunction_dict.update({'__hash__': hsh})
 
@@ -111,7 +112,13 @@ def operator_function_factory(property_indices) -> dict:
         #
         # The other option is to create a large table of classes and store them, so that, if we were to generate a
         # class with the same signature, we'd just use the previously created one. That's equally as messy, I think,
-        # because now we have global state, which is less than ideal for a library like this.
+        # because now we have global state, which is less than ideal for a library like this. SparsePoints are the one
+        # exception: their classes can hold tens of thousands of names, so a small, bounded cache of them is kept in
+        # geometry.base rather than rebuilding all of that for every instance.
+        if sparse.is_sparse(other):
+            # Let the SparsePoint compare itself against our values, instead of iterating over all of its zeros
+            return other.__eq__(self)
+
         if str(type(other)) != str(type(self)) or self.signature != other.signature:
             raise TypeError(type_error_description % (str(type(self)), str(type(other))))
 
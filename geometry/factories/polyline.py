@@ -0,0 +1,108 @@
+import numpy as np
+
+
+def init_factory(parent_class=None) -> callable:
+    """Function factory to initialize a parent class if there is one, else return a basic __init__."""
+    if parent_class is None:
+        def init(self):
+            pass
+    else:
+        def init(self):
+            parent_class.__init__(self)
+
+    return init
+
+
+def getitem_factory() -> callable:
+    """Function factory for accessing the vertices of an internal Batch called _vertices"""
+
+    def getitem(self, key):
+        return self._vertices[key]
+
+    return getitem
+
+
+def len_factory() -> callable:
+    """Function factory for the number of vertices in an internal Batch called _vertices"""
+
+    def length(self):
+        return len(self._vertices)
+
+    return length
+
+
+def vertices_property_factory() -> property:
+    """Create a read-only property exposing the internal Batch of vertices, without copying it"""
+
+    def vertices_get(self):
+        return self._vertices
+
+    prop = property(vertices_get)
+
+    return prop
+
+
+def dimension_property_factory() -> property:
+    def dimension_get(self):
+        return self._vertices.dimension
+
+    dimension = property(dimension_get)
+
+    return dimension
+
+
+def signature_property_factory(point) -> property:
+    """Will return a hash uniquely identifying the dimension and attributes of the geometry."""
+
+    sig = hash(('Polyline', tuple(dir(point)), point.signature))
+
+    def signature_get(self):
+        return sig
+
+    dimension = property(signature_get)
+
+    return dimension
+
+
+def operator_function_factory() -> dict:
+    """Defines custom functions for the operators == and !=, as well as __hash__ and __repr__"""
+    multifunction_dict = {}
+    type_error_description = \
+        'This operation is not defined for types %s and %s. This error can ' + \
+        'also occur if the dimensions of the objects are the same, but the attribute names are different. ' + \
+        'This is intentionally done to prevent operations done on objects of the same dimensionality, but in' + \
+        'different vector spaces or coordinate systems.'
+
+    def rep(self):
+        return ' -> '.join(repr(vertex) for vertex in self._vertices)
+
+    multifunction_dict.update({'__repr__': rep})
+
+    def hsh(self):
+        return hash((tuple(np.round(self._vertices.values, 8).reshape(-1)), self.signature))
+
+    multifunction_dict.update({'__hash__': hsh})
+
+    def directory(self):
+        return dir(self._vertices._template)
+
+    multifunction_dict.update({'__dir__': directory})
+
+    def eq(self, other):
+        if str(type(other)) != str(type(self)) or self.signature != other.signature:
+            raise TypeError(type_error_description % (str(type(self)), str(type(other))))
+
+        if len(self._vertices) != len(other._vertices):
+            return False
+
+        # Same tolerance as Points, vertex by vertex
+        return bool(np.all(np.abs(self._vertices.values - other._vertices.values) < 1e-8))
+
+    multifunction_dict.update({'__eq__': eq})
+
+    def ne(self, other):
+        return not self.__eq__(other)
+
+    multifunction_dict.update({'__ne__': ne})
+
+    return multifunction_dict
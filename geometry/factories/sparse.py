@@ -0,0 +1,380 @@
+import numpy as np
+from copy import deepcopy
+from geometry.batch import Batch
+from geometry.functions import sparse, vector
+
+
+def init_factory(parent_class=None) -> callable:
+    """Function factory to initialize a parent class if there is one, else return a basic __init__."""
+    if parent_class is None:
+        def init(self):
+            pass
+    else:
+        def init(self):
+            parent_class.__init__(self)
+
+    return init
+
+
+def getitem_factory() -> callable:
+    """Function factory for reading a value out of the internal arrays _indices and _data, zero if it isn't stored"""
+
+    def getitem(self, key):
+        key = sparse.normalize_index(key, self.dimension)
+        position = np.searchsorted(self._indices, key)
+
+        if position < len(self._indices) and self._indices[position] == key:
+            return self._data[position]
+
+        return np.complex128(0.0)
+
+    return getitem
+
+
+def setitem_factory() -> callable:
+    """Function factory for writing a value into the internal arrays _indices and _data, dropping explicit zeros"""
+
+    def setitem(self, key, value):
+        key = sparse.normalize_index(key, self.dimension)
+        value = complex(value)
+        position = np.searchsorted(self._indices, key)
+        stored = position < len(self._indices) and self._indices[position] == key
+
+        if stored and value == 0:
+            self._indices = np.delete(self._indices, position)
+            self._data = np.delete(self._data, position)
+        elif stored:
+            self._data[position] = value
+        elif value != 0:
+            self._indices = np.insert(self._indices, position, key)
+            self._data = np.insert(self._data, position, value)
+
+    return setitem
+
+
+def getattr_factory() -> callable:
+    """
+    Function factory for looking up named attributes through the class-wide _names dictionary.
+
+    Dense Points create a property for every keyword, which gets very expensive with tens of thousands of named
+    dimensions. __getattr__ is only called when regular attribute lookup fails, so a single dictionary does the same
+    job.
+    """
+
+    def getattribute(self, attr):
+        names = type(self).__dict__.get('_names', {})
+
+        if attr in names:
+            return self[names[attr]]
+
+        raise AttributeError("'%s' object has no attribute '%s'" % (type(self).__name__, attr))
+
+    return getattribute
+
+
+def setattr_factory() -> callable:
+    """Function factory for setting named attributes through the class-wide _names dictionary."""
+
+    def setattribute(self, attr, value):
+        names = type(self).__dict__.get('_names', {})
+
+        if attr in names:
+            self[names[attr]] = value
+        else:
+            object.__setattr__(self, attr, value)
+
+    return setattribute
+
+
+def point_dimension_property_factory(dimension) -> property:
+    def dimension_get(self):
+        return dimension
+
+    dimension_prop = property(dimension_get)
+
+    return dimension_prop
+
+
+def point_operator_function_factory(property_indices) -> dict:
+    """Defines custom functions for the operators == and !=, as well as __hash__ and __repr__"""
+    multifunction_dict = {}
+    type_error_description = \
+        'This operation is not defined for types %s and %s. This error can ' + \
+        'also occur if the dimensions of the objects are the same, but the attribute names are different. ' + \
+        'This is intentionally done to prevent operations done on objects of the same dimensionality, but in' + \
+        'different vector spaces or coordinate systems.'
+    property_list = tuple([prop[0] for prop in property_indices])
+
+    def rep(self):
+        # Only the stored values are printed, since the whole point of a sparse geometry is that most of it is zero
+        rep_str = '('
+        for index, val in zip(self._indices, self._data):
+            rep_str += '%i: %.2f, ' % (index, val.real) if val.imag == 0 else \
+                '%i: %.2f + %.2fj, ' % (index, val.real, val.imag)
+        return rep_str[:len(rep_str) - 2] + ')' if len(self._indices) > 0 else '()'
+
+    multifunction_dict.update({'__repr__': rep})
+
+    def hsh(self):
+        # Hashed the same way as dense Points, since the two compare equal when their values are
+        return sparse.hash_values(self.dimension, self._indices, self._data, property_indices)
+
+    multifunction_dict.update({'__hash__': hsh})
+
+    def directory(self):
+        return property_list
+
+    multifunction_dict.update({'__dir__': directory})
+
+    def eq(self, other):
+        # Same philosophy as dense Points: comparing across signatures is an error, not a False. Dense Points with the
+        # same signature are the same geometry stored differently, so those compare by value.
+        dense_type = str(type(self)).replace(" SparsePoint'>", " Point'>")
+
+        if str(type(other)) not in (str(type(self)), dense_type) or self.signature != other.signature:
+            raise TypeError(type_error_description % (str(type(self)), str(type(other))))
+
+        if str(type(other)) == dense_type:
+            difference = np.array(other._values)
+            difference[self._indices] -= self._data
+        else:
+            _, difference = sparse.add_arrays(self._indices, self._data, other._indices, -other._data)
+
+        # Same tolerance as dense Points, so the two agree on what counts as equal
+        return bool(np.all(np.abs(difference) < 1e-8))
+
+    multifunction_dict.update({'__eq__': eq})
+
+    def ne(self, other):
+        return not self.__eq__(other)
+
+    multifunction_dict.update({'__ne__': ne})
+
+    def to_dense(self):
+        return sparse.to_dense(self)
+
+    multifunction_dict.update({'to_dense': to_dense})
+
+    return multifunction_dict
+
+
+def vector_getitem_factory() -> callable:
+    """Function factory for accessing an internal SparsePoint object _point"""
+
+    def getitem(self, key):
+        return self._point[key]
+
+    return getitem
+
+
+def vector_setitem_factory() -> callable:
+    """Function factory for setting values in an internal SparsePoint object _point"""
+
+    def setitem(self, key, value):
+        self._point[key] = value
+
+    return setitem
+
+
+def vector_getattr_factory() -> callable:
+    """Function factory for looking up named attributes on an internal SparsePoint object _point"""
+
+    def getattribute(self, attr):
+        # Guard against recursion while the instance doesn't have a _point yet (e.g. halfway through a deepcopy)
+        if attr.startswith('_'):
+            raise AttributeError("'%s' object has no attribute '%s'" % (type(self).__name__, attr))
+
+        return getattr(self._point, attr)
+
+    return getattribute
+
+
+def vector_setattr_factory() -> callable:
+    """Function factory for setting named attributes on an internal SparsePoint object _point"""
+
+    def setattribute(self, attr, value):
+        # Look the name up in the SparsePoint's dictionary, rather than scanning through every name with dir()
+        if not attr.startswith('_') and attr in type(self._point).__dict__.get('_names', {}):
+            setattr(self._point, attr, value)
+        else:
+            object.__setattr__(self, attr, value)
+
+    return setattribute
+
+
+def vector_dimension_property_factory() -> property:
+    def dimension_get(self):
+        return self._point.dimension
+
+    dimension = property(dimension_get)
+
+    return dimension
+
+
+def vector_operator_function_factory() -> dict:
+    """
+    Defines custom functions for the operators +, -, *, /, ==, and **, as well as __hash__ and __repr__
+
+    Operations that keep zeros at zero (sums of sparse vectors and scaling by a scalar) stay sparse and scale with the
+    number of stored values. Operations that don't (adding a scalar, adding a dense Vector, reciprocals) give back a
+    dense Vector.
+    """
+    multifunction_dict = {}
+    type_error_description = \
+        'This operation is not defined for types %s and %s. This error can ' + \
+        'also occur if the dimensions of the objects are the same, but the attribute names are different. ' + \
+        'This is intentionally done to prevent operations done on objects of the same dimensionality, but in' + \
+        'different vector spaces or coordinate systems.'
+    signature_error_description = \
+        'Signature mismatch. The dimensions of the objects are the same, but the attribute names are ' + \
+        'different. This error is intentionally thrown to prevent operations done on objects of the same ' + \
+        'dimensionality, but in different vector spaces or coordinate systems.'
+    scalar_operation_error_description = \
+        'This operation is not defined for two objects of type %s. One of the operators must be a scalar number. ' + \
+        'If multiplication between two %ss is desired, use either the inner() or outer() functions for the inner ' + \
+        'outer products, respectively.'
+
+    def is_batched(other):
+        return isinstance(other, Batch) or (isinstance(other, np.ndarray) and other.ndim > 0)
+
+    multifunction_dict.update({'__array_ufunc__': None})
+
+    def rep(self):
+        return '<' + repr(self._point)[1:-1] + '>'
+
+    multifunction_dict.update({'__repr__': rep})
+
+    def hsh(self):
+        return hash(self._point.__hash__())
+
+    multifunction_dict.update({'__hash__': hsh})
+
+    def directory(self):
+        return dir(self._point)
+
+    multifunction_dict.update({'__dir__': directory})
+
+    def eq(self, other):
+        try:
+            return self._point == other._point
+        except (TypeError, AttributeError):
+            raise TypeError(type_error_description % (str(type(self)), str(type(other))))
+
+    multifunction_dict.update({'__eq__': eq})
+
+    def ne(self, other):
+        return not self.__eq__(other)
+
+    multifunction_dict.update({'__ne__': ne})
+
+    def add(self, other):
+        # Rows of a Batch are dense anyway, so broadcasting goes through the dense Vector
+        if is_batched(other):
+            return sparse.to_dense(self) + other
+
+        if sparse.is_sparse(other):
+            if str(type(other)) != str(type(self)) or self.signature != other.signature:
+                raise TypeError(signature_error_description)
+
+            final_answer = deepcopy(self)
+            final_answer._point._indices, final_answer._point._data = sparse.add_arrays(
+                self._point._indices, self._point._data, other._point._indices, other._point._data)
+
+            return final_answer
+
+        if hasattr(other, 'signature'):
+            if self.signature != other.signature:
+                raise TypeError(signature_error_description)
+
+            # Dense plus sparse is dense, so scatter our stored values into a copy of the dense operand
+            final_answer = deepcopy(other)
+            final_answer._point._values[self._point._indices] += self._point._data
+
+            return final_answer
+
+        # Adding a scalar touches every dimension, so there's nothing left to be sparse about
+        return sparse.to_dense(self) + other
+
+    multifunction_dict.update({'__add__': add})
+
+    def radd(self, other):
+        return self.__add__(other)
+
+    multifunction_dict.update({'__radd__': radd})
+
+    def sub(self, other):
+        return self.__add__(- other)
+
+    multifunction_dict.update({'__sub__': sub})
+
+    def rsub(self, other):
+        return self.__neg__().__add__(other)
+
+    multifunction_dict.update({'__rsub__': rsub})
+
+    def mul(self, other):
+        if is_batched(other):
+            return sparse.to_dense(self) * other
+
+        if not np.isscalar(other):
+            raise TypeError(scalar_operation_error_description % (str(type(self)), str(type(self))))
+
+        final_answer = deepcopy(self)
+        final_answer._point._data = self._point._data * complex(other)
+
+        if other == 0:
+            final_answer._point._indices = final_answer._point._indices[:0]
+            final_answer._point._data = final_answer._point._data[:0]
+
+        return final_answer
+
+    multifunction_dict.update({'__mul__': mul})
+
+    def rmul(self, other):
+        return self.__mul__(other)
+
+    multifunction_dict.update({'__rmul__': rmul})
+
+    def truediv(self, other):
+        if is_batched(other):
+            return sparse.to_dense(self) / other
+
+        if not np.isscalar(other):
+            raise TypeError(scalar_operation_error_description % (str(type(self)), str(type(self))))
+
+        return self * (1.0 / complex(other))
+
+    multifunction_dict.update({'__truediv__': truediv})
+
+    def rtruediv(self, other):
+        return other / sparse.to_dense(self)
+
+    multifunction_dict.update({'__rtruediv__': rtruediv})
+
+    def neg(self):
+        return -1.0 * self
+
+    multifunction_dict.update({'__neg__': neg})
+
+    def inv(self):
+        return 1.0 / self
+
+    multifunction_dict.update({'__invert__': inv})
+
+    def to_dense(self):
+        return sparse.to_dense(self)
+
+    multifunction_dict.update({'to_dense': to_dense})
+
+    return multifunction_dict
+
+
+def norm_function_factory() -> callable:
+    """Function factory to return a vector norm in complex space, in time proportional to the stored values."""
+
+    def norm(self) -> complex:
+        inner_product = vector.inner(self, self)
+
+        return inner_product ** 0.5
+
+    return norm
@@ -1,6 +1,7 @@
 import numpy as np
 from copy import deepcopy
-from geometry.functions import vector
+from geometry.batch import Batch
+from geometry.functions import sparse, vector
 
 
 def init_factory(parent_class=None) -> callable:
@@ -86,6 +87,15 @@ def operator_function_factory() -> dict:
         'If multiplication between two %ss is desired, use either the inner() or outer() functions for the inner ' + \
         'outer products, respectively.'
 
+    def is_batched(other):
+        # Batches, and arrays with one scalar per row, broadcast a single Vector against many rows at once. That's
+        # the Batch's job, so those operations are handed over to it with this Vector as a Batch of one.
+        return isinstance(other, Batch) or (isinstance(other, np.ndarray) and other.ndim > 0)
+
+    # Stops numpy from applying its own operators elementwise to Vectors, so that e.g. array * Vector ends up in
+    # __rmul__ below instead of building an array of Vectors.
+    multifunction_dict.update({'__array_ufunc__': None})
+
     def rep(self):
         rep_str = '<'
         for i in range(0, self.dimension):
@@ -126,6 +136,13 @@ def operator_function_factory() -> dict:
     multifunction_dict.update({'__ne__': ne})
 
     def add(self, other):
+        # Sparse Vectors know how to add themselves to dense ones, so hand the operation over to their __radd__
+        if sparse.is_sparse(other):
+            return NotImplemented
+
+        if is_batched(other):
+            return Batch.from_geometries([self]) + other
+
         # By using a deepcopy we don't have to worry about creating a whole new class just to make another vector
         final_answer = deepcopy(self)
 
@@ -160,6 +177,9 @@ def operator_function_factory() -> dict:
     multifunction_dict.update({'__rsub__': rsub})
 
     def mul(self, other):
+        if is_batched(other):
+            return Batch.from_geometries([self]) * other
+
         final_answer = deepcopy(self)
 
         # Multiplication (and division) should only be defined for Vectors and scalar types. Vector multiplication is
@@ -180,6 +200,9 @@ def operator_function_factory() -> dict:
     multifunction_dict.update({'__rmul__': rmul})
 
     def truediv(self, other):
+        if is_batched(other):
+            return Batch.from_geometries([self]) / other
+
         final_answer = deepcopy(self)
 
         if not np.isscalar(other):
@@ -190,6 +213,9 @@ def operator_function_factory() -> dict:
     multifunction_dict.update({'__truediv__': truediv})
 
     def rtruediv(self, other):
+        if is_batched(other):
+            return other / Batch.from_geometries([self])
+
         final_answer = deepcopy(self)
 
         if not np.isscalar(other):
@@ -0,0 +1,119 @@
+import numpy as np
+from copy import deepcopy
+
+_type_error_description = \
+    'This operation is not defined for types %s and %s. This error can ' + \
+    'also occur if the dimensions of the objects are the same, but the attribute names are different. ' + \
+    'This is intentionally done to prevent operations done on objects of the same dimensionality, but in' + \
+    'different vector spaces or coordinate systems.'
+
+
+def _type_check(box_1, box_2):
+    # Defer the type import so we don't get a circular reference, same as in geometry.functions.vector
+    from geometry.base import Geometry
+
+    type_repr_1 = str(type(box_1))
+    type_repr_2 = str(type(box_2))
+
+    if type_repr_1 != type_repr_2 \
+            or Geometry not in box_1.__class__.__bases__ \
+            or Geometry not in box_2.__class__.__bases__ \
+            or box_1.signature != box_2.signature \
+            or type_repr_1[len(type_repr_1) - 6:len(type_repr_1) - 2] != 'AABB':
+        raise TypeError(_type_error_description % (str(type(box_1)), str(type(box_2))))
+
+
+def _as_batch(box, points):
+    from geometry.batch import Batch
+
+    if not isinstance(points, Batch):
+        points = Batch.from_geometries(points)
+
+    # One signature check for the whole batch against the corners of the box
+    if points.signature != box._minimum.signature:
+        raise TypeError(_type_error_description % (str(type(box)), repr(points)))
+
+    return points
+
+
+def contains(box, points):
+    """
+    Tests which points lie inside of box, boundaries included.
+
+    A single Point gives back a bool. A Batch (or any iterable of same-signature Points) gives back a boolean array
+    with one entry per point, computed in a single pass over the batch storage.
+    """
+    from geometry.batch import Batch
+
+    if hasattr(points, 'signature') and not isinstance(points, Batch):
+        return points in box
+
+    values = _as_batch(box, points).values.real
+
+    return np.all((values >= box._minimum._values.real) & (values <= box._maximum._values.real), axis=1)
+
+
+def intersects(box_1, box_2) -> bool:
+    _type_check(box_1, box_2)
+
+    return bool(np.all(box_1._minimum._values.real <= box_2._maximum._values.real) and
+                np.all(box_2._minimum._values.real <= box_1._maximum._values.real))
+
+
+def intersection(box_1, box_2):
+    """Returns the box where box_1 and box_2 overlap, or None if they don't."""
+    from geometry.base import AABB
+
+    if not intersects(box_1, box_2):
+        return None
+
+    minimum = deepcopy(box_1._minimum)
+    maximum = deepcopy(box_1._maximum)
+    minimum._values = np.maximum(box_1._minimum._values.real, box_2._minimum._values.real).astype(complex)
+    maximum._values = np.minimum(box_1._maximum._values.real, box_2._maximum._values.real).astype(complex)
+
+    return AABB(minimum, maximum)
+
+
+def union(box_1, box_2):
+    """Returns the smallest box that contains both box_1 and box_2."""
+    from geometry.base import AABB
+
+    _type_check(box_1, box_2)
+
+    minimum = deepcopy(box_1._minimum)
+    maximum = deepcopy(box_1._maximum)
+    minimum._values = np.minimum(box_1._minimum._values.real, box_2._minimum._values.real).astype(complex)
+    maximum._values = np.maximum(box_1._maximum._values.real, box_2._maximum._values.real).astype(complex)
+
+    return AABB(minimum, maximum)
+
+
+def query(boxes, points, block_size=64) -> list:
+    """
+    Tests many boxes against many points at once, and returns one array of point indices for every box.
+
+    Boxes are tested in blocks of block_size so that the intermediate (boxes, points, dimension) comparison never gets
+    out of hand for large point sets.
+    """
+    boxes = list(boxes)
+
+    if len(boxes) == 0:
+        return []
+
+    for box in boxes[1:]:
+        _type_check(boxes[0], box)
+
+    values = _as_batch(boxes[0], points).values.real
+    minimums = np.stack([box._minimum._values.real for box in boxes])
+    maximums = np.stack([box._maximum._values.real for box in boxes])
+
+    indices = []
+
+    for start in range(0, len(boxes), block_size):
+        block_min = minimums[start:start + block_size, np.newaxis, :]
+        block_max = maximums[start:start + block_size, np.newaxis, :]
+        inside = np.all((values >= block_min) & (values <= block_max), axis=2)
+        indices.extend(np.flatnonzero(row) for row in inside)
+
+    return indices
@@ -0,0 +1,110 @@
+import numpy as np
+from geometry.batch import Batch
+from geometry.functions import vector
+
+_keyframe_error_description = \
+    'Interpolation needs at least two keyframes, and exactly one strictly increasing time per keyframe.'
+
+
+def _keyframes(keyframes, times):
+    # Reusing the Vector batching from geometry.functions.vector gets us the same signature checks as everywhere else
+    keyframes, _ = vector._as_batch(keyframes)
+    times = np.arange(len(keyframes), dtype=float) if times is None else np.asarray(times, dtype=float)
+
+    if len(keyframes) < 2 or times.shape != (len(keyframes),) or np.any(np.diff(times) <= 0):
+        raise ValueError(_keyframe_error_description)
+
+    return keyframes, times
+
+
+def _segments(times, t):
+    """Returns the segment every parameter in t falls in, and its local parameter within that segment."""
+    t = np.atleast_1d(np.asarray(t, dtype=float))
+
+    # Parameters outside of the keyframe times extrapolate from the first or last segment
+    segment = np.clip(np.searchsorted(times, t, side='right') - 1, 0, len(times) - 2)
+    local = (t - times[segment]) / (times[segment + 1] - times[segment])
+
+    return segment, local
+
+
+def lerp(keyframes, t, times=None) -> Batch:
+    """
+    Linearly interpolates a series of keyframe Vectors at every parameter in t, in a single vectorized pass.
+
+    Keyframe k sits at times[k], which defaults to k, so two keyframes with t in [0, 1] give the usual a + (b - a) * t.
+    """
+    keyframes, times = _keyframes(keyframes, times)
+    segment, local = _segments(times, t)
+
+    start = keyframes.values[segment]
+    end = keyframes.values[segment + 1]
+
+    return Batch(keyframes._template, start + (end - start) * local[:, np.newaxis])
+
+
+def slerp(keyframes, t, times=None) -> Batch:
+    """
+    Spherically interpolates a series of keyframe Vectors at every parameter in t.
+
+    The angle between neighbouring keyframes is computed the same way as geometry.functions.vector.angle, and the
+    interpolated Vectors sweep through it at a constant rate. Segments between (nearly) parallel keyframes fall back to
+    linear interpolation, where the spherical formula is numerically meaningless. Segments between antiparallel
+    keyframes raise a ValueError, since there is no unique great circle to interpolate along.
+    """
+    keyframes, times = _keyframes(keyframes, times)
+    segment, local = _segments(times, t)
+
+    start = keyframes.values[segment]
+    end = keyframes.values[segment + 1]
+
+    norms = np.sqrt(np.sum(start * start, axis=1)) * np.sqrt(np.sum(end * end, axis=1))
+
+    if np.any(np.isclose(norms, 0.0)):
+        raise ZeroDivisionError('Spherical interpolation is not defined for keyframes with magnitude = 0.')
+
+    cos_omega = np.sum(start * end, axis=1) / norms
+    omega = np.arccos(cos_omega)
+    sin_omega = np.sin(omega)
+    parallel = np.isclose(sin_omega, 0.0) & (np.real(cos_omega) > 0)
+
+    # Every great circle through antiparallel keyframes is equally short, so there's no single answer to give
+    if np.any(np.isclose(sin_omega, 0.0) & ~parallel):
+        raise ValueError('Spherical interpolation is not defined between antiparallel keyframes.')
+
+    sin_omega = np.where(parallel, 1.0, sin_omega)
+
+    weight_start = np.where(parallel, 1.0 - local, np.sin((1.0 - local) * omega) / sin_omega)
+    weight_end = np.where(parallel, local, np.sin(local * omega) / sin_omega)
+
+    return Batch(keyframes._template, start * weight_start[:, np.newaxis] + end * weight_end[:, np.newaxis])
+
+
+def catmull_rom(keyframes, t, times=None) -> Batch:
+    """
+    Evaluates a Catmull-Rom spline through a series of keyframe Vectors at every parameter in t.
+
+    The spline passes through every keyframe. Tangents are central differences over the neighbouring keyframes (and
+    one-sided differences at the ends), which reduces to the classic uniform Catmull-Rom spline when times are evenly
+    spaced.
+    """
+    keyframes, times = _keyframes(keyframes, times)
+    segment, local = _segments(times, t)
+    values = keyframes.values
+
+    tangents = np.empty_like(values)
+    tangents[1:-1] = (values[2:] - values[:-2]) / (times[2:] - times[:-2])[:, np.newaxis]
+    tangents[0] = (values[1] - values[0]) / (times[1] - times[0])
+    tangents[-1] = (values[-1] - values[-2]) / (times[-1] - times[-2])
+
+    # Cubic Hermite basis functions, with the tangents scaled to the length of each segment
+    span = (times[segment + 1] - times[segment])[:, np.newaxis]
+    u = local[:, np.newaxis]
+    u2 = u * u
+    u3 = u2 * u
+
+    return Batch(keyframes._template,
+                 (2 * u3 - 3 * u2 + 1) * values[segment] +
+                 (u3 - 2 * u2 + u) * span * tangents[segment] +
+                 (-2 * u3 + 3 * u2) * values[segment + 1] +
+                 (u3 - u2) * span * tangents[segment + 1])
@@ -0,0 +1,175 @@
+import numpy as np
+from geometry.batch import Batch
+
+_type_error_description = \
+    'This operation is not defined for types %s and %s. This error can ' + \
+    'also occur if the dimensions of the objects are the same, but the attribute names are different. ' + \
+    'This is intentionally done to prevent operations done on objects of the same dimensionality, but in' + \
+    'different vector spaces or coordinate systems.'
+
+# Upper limit on the size of the (queries, segments, dimension) intermediates in closest_point
+_block_bytes = 16 * 2 ** 20
+
+
+def _type_check(line):
+    # Defer the type import so we don't get a circular reference, same as in geometry.functions.vector
+    from geometry.base import Geometry
+
+    type_repr = str(type(line))
+
+    if Geometry not in line.__class__.__bases__ or type_repr[len(type_repr) - 10:len(type_repr) - 2] != 'Polyline':
+        raise TypeError(_type_error_description % (type_repr, 'Polyline'))
+
+
+def _segment_vectors(line) -> np.ndarray:
+    return np.diff(line.vertices.values, axis=0)
+
+
+def segment_lengths(line) -> np.ndarray:
+    """Returns the length of every segment of a Polyline, all at once."""
+    _type_check(line)
+
+    return np.sqrt(np.sum(np.abs(_segment_vectors(line)) ** 2, axis=1))
+
+
+def arc_length(line) -> np.ndarray:
+    """Returns the cumulative length along a Polyline at every vertex, starting at 0 at the first vertex."""
+    return np.concatenate([[0.0], np.cumsum(segment_lengths(line))])
+
+
+def length(line) -> float:
+    return float(np.sum(segment_lengths(line)))
+
+
+def _at_arc_length(line, distances) -> np.ndarray:
+    cumulative = arc_length(line)
+    values = line.vertices.values
+
+    distances = np.clip(distances, 0.0, cumulative[-1])
+    segment = np.clip(np.searchsorted(cumulative, distances, side='right') - 1, 0, len(values) - 2)
+
+    spans = cumulative[segment + 1] - cumulative[segment]
+    local = np.divide(distances - cumulative[segment], spans, out=np.zeros(len(distances)), where=spans > 0)
+
+    return values[segment] + (values[segment + 1] - values[segment]) * local[:, np.newaxis]
+
+
+def resample(line, count):
+    """Returns a Polyline with count vertices spaced evenly by arc length along line, keeping both end points."""
+    from geometry.base import Polyline
+
+    if count < 2:
+        raise ValueError('A Polyline needs at least two vertices, so count must be at least 2.')
+
+    return Polyline(Batch(line.vertices._template, _at_arc_length(line, np.linspace(0.0, length(line), count))))
+
+
+def _distances_to_segment(values, start, end) -> np.ndarray:
+    direction = end - start
+    squared_length = np.sum(np.abs(direction) ** 2)
+
+    if squared_length == 0:
+        return np.sqrt(np.sum(np.abs(values - start) ** 2, axis=1))
+
+    local = np.clip(np.real((values - start) @ direction.conj()) / squared_length, 0.0, 1.0)
+
+    return np.sqrt(np.sum(np.abs(values - start - local[:, np.newaxis] * direction) ** 2, axis=1))
+
+
+def simplify(line, tolerance):
+    """
+    Douglas-Peucker simplification: drops every vertex that lies within tolerance of the simplified Polyline.
+
+    The recursion is run with an explicit stack, and the distances of every vertex in a span to its chord are computed
+    in one vectorized pass, so long paths neither hit the recursion limit nor loop over vertices in Python.
+    """
+    from geometry.base import Polyline
+
+    _type_check(line)
+    values = line.vertices.values
+    keep = np.zeros(len(values), dtype=bool)
+    keep[[0, -1]] = True
+
+    spans = [(0, len(values) - 1)]
+
+    while len(spans) > 0:
+        first, last = spans.pop()
+
+        if last - first < 2:
+            continue
+
+        distances = _distances_to_segment(values[first + 1:last], values[first], values[last])
+        farthest = int(np.argmax(distances))
+
+        if distances[farthest] > tolerance:
+            split = first + 1 + farthest
+            keep[split] = True
+            spans.append((first, split))
+            spans.append((split, last))
+
+    return Polyline(Batch(line.vertices._template, values[keep]))
+
+
+def closest_point(line, points, block_size=4096):
+    """
+    Finds the closest point on line for every point in a Batch (or a single Point).
+
+    Returns a Batch of the closest points, the index of the segment each one lies on, the arc length along line at
+    which it lies, and its distance to the query point. Queries are processed block_size at a time, against as many
+    segments at once as fit in a fixed memory budget, so long paths don't blow up the intermediate arrays.
+    """
+    _type_check(line)
+
+    single = not isinstance(points, Batch)
+    queries = Batch.from_geometries([points]) if single else points
+
+    if queries.signature != line.vertices.signature:
+        raise TypeError(_type_error_description % (str(type(line)), repr(queries)))
+
+    starts = line.vertices.values[:-1]
+    directions = _segment_vectors(line)
+    squared_lengths = np.sum(np.abs(directions) ** 2, axis=1)
+    cumulative = arc_length(line)
+
+    closest = np.repeat(starts[:1], len(queries), axis=0)
+    segments = np.zeros(len(queries), dtype=np.int64)
+
+    item_bytes = queries.values.itemsize * queries.dimension
+    block_size = max(1, min(block_size, _block_bytes // item_bytes))
+
+    for start in range(0, len(queries), block_size):
+        block = queries.values[start:start + block_size]
+        segment_block = max(1, _block_bytes // (len(block) * item_bytes))
+
+        best = np.full(len(block), np.inf)
+
+        for first in range(0, len(starts), segment_block):
+            last = first + segment_block
+            block_starts, block_directions = starts[first:last], directions[first:last]
+            block_lengths = squared_lengths[first:last]
+
+            # (queries, segments) projection of every query onto every segment in the block, clamped to the segment
+            offsets = block[:, np.newaxis, :] - block_starts[np.newaxis, :, :]
+            local = np.divide(np.real(np.einsum('qsd,sd->qs', offsets, block_directions.conj())), block_lengths,
+                              out=np.zeros((len(block), len(block_starts))), where=block_lengths > 0)
+            local = np.clip(local, 0.0, 1.0)
+
+            candidates = block_starts[np.newaxis, :, :] + local[:, :, np.newaxis] * block_directions[np.newaxis, :, :]
+            distances = np.sum(np.abs(candidates - block[:, np.newaxis, :]) ** 2, axis=2)
+            nearest = np.argmin(distances, axis=1)
+            nearest_distances = distances[np.arange(len(block)), nearest]
+
+            # Strictly closer only, so ties go to the earliest segment no matter how the segments were split up
+            better = nearest_distances < best
+            best[better] = nearest_distances[better]
+            closest[start:start + block_size][better] = candidates[np.flatnonzero(better), nearest[better]]
+            segments[start:start + block_size][better] = first + nearest[better]
+
+    along = cumulative[segments] + np.sqrt(np.sum(np.abs(closest - starts[segments]) ** 2, axis=1))
+    distances = np.sqrt(np.sum(np.abs(closest - queries.values) ** 2, axis=1))
+    closest = Batch(queries._template, closest)
+
+    if single:
+        return closest[0], segments[0], along[0], distances[0]
+
+    return closest, segments, along, distances
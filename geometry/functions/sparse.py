@@ -0,0 +1,97 @@
+import numpy as np
+
+
+def is_sparse(geometry) -> bool:
+    return str(type(geometry)).endswith((" SparsePoint'>", " SparseVector'>"))
+
+
+def normalize_index(key, dimension) -> int:
+    """Turns negative indices into positive ones and bounds checks the result, the way numpy arrays do for dense."""
+    if not isinstance(key, (int, np.integer)):
+        raise TypeError('Sparse geometries can only be indexed with integers, got %s.' % str(type(key)))
+
+    if key < 0:
+        key += dimension
+
+    if key < 0 or key >= dimension:
+        raise IndexError('index %i is out of bounds for a geometry of dimension %i' % (key, dimension))
+
+    return int(key)
+
+
+def canonicalize(indices, data):
+    """Sorts indices, sums duplicates and drops explicit zeros, so every sparse geometry is stored the same way."""
+    indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+    data = np.asarray(data, dtype=complex).reshape(-1)
+
+    if len(indices) != len(data):
+        raise ValueError('Sparse geometries need exactly one value per index, got %i indices and %i values.' %
+                         (len(indices), len(data)))
+
+    unique, inverse = np.unique(indices, return_inverse=True)
+    summed = np.zeros(len(unique), dtype=complex)
+    np.add.at(summed, inverse, data)
+
+    nonzero = summed != 0
+
+    return unique[nonzero], summed[nonzero]
+
+
+def add_arrays(indices_1, data_1, indices_2, data_2):
+    """Sums two sparse (indices, data) pairs in time proportional to the number of stored values."""
+    return canonicalize(np.concatenate([indices_1, indices_2]), np.concatenate([data_1, data_2]))
+
+
+def hash_values(dimension, indices, data, property_indices) -> int:
+    """
+    Hashes the values of a Point from its non-zero entries only, so that sparse and dense Points with equal values and
+    the same layout hash the same. Values are rounded to 8 decimals first, the same tolerance equality uses.
+    """
+    data = np.round(np.asarray(data, dtype=complex), 8)
+    stored = data != 0
+
+    return hash((dimension, tuple(np.asarray(indices)[stored]), tuple(data[stored]), property_indices))
+
+
+def inner(vector_1, vector_2) -> complex:
+    """
+    Inner product where at least one of the two Vectors is sparse. Signatures are expected to have been checked.
+
+    Only the stored values of the sparse operand are ever touched, so the cost scales with the number of non-zeros
+    rather than the dimension.
+    """
+    if is_sparse(vector_1) and is_sparse(vector_2):
+        _, position_1, position_2 = np.intersect1d(
+            vector_1._point._indices, vector_2._point._indices, assume_unique=True, return_indices=True)
+
+        return np.sum(vector_1._point._data[position_1] * vector_2._point._data[position_2])
+
+    if not is_sparse(vector_1):
+        vector_1, vector_2 = vector_2, vector_1
+
+    return np.sum(vector_1._point._data * vector_2._point._values[vector_1._point._indices])
+
+
+def to_dense(geometry):
+    """Returns the dense Point or Vector with the same signature and values as a SparsePoint or SparseVector."""
+    from geometry.batch import template
+
+    point = geometry._point if hasattr(geometry, '_point') else geometry
+
+    dense = template(point.dimension, dir(point), vector=hasattr(geometry, '_point'))
+    values = dense._point._values if hasattr(geometry, '_point') else dense._values
+    values[point._indices] = point._data
+
+    return dense
+
+
+def from_dense(geometry):
+    """Returns the SparsePoint or SparseVector with the same signature and values as a dense Point or Vector."""
+    from geometry.base import SparsePoint, SparseVector
+
+    point = geometry._point if hasattr(geometry, '_point') else geometry
+    indices = np.flatnonzero(point._values)
+
+    sparse_point = SparsePoint(indices, point._values[indices], dimension=point.dimension, names=dir(point))
+
+    return SparseVector(sparse_point) if hasattr(geometry, '_point') else sparse_point
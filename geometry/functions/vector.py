@@ -1,5 +1,7 @@
 import numpy as np
 from copy import deepcopy
+from geometry.batch import Batch
+from geometry.functions import sparse
 
 _type_error_description = \
     'This operation is not defined for types %s and %s. This error can ' + \
@@ -10,14 +12,46 @@ _type_error_description = \
 _dimensionality_error_description = \
     'This operation is not defined for vectors with dimensionality %i.'
 
+_dependence_error_description = \
+    'The Vectors are linearly dependent, so there is no orthonormal set with the same number of Vectors that spans ' + \
+    'them. Use span() to get an orthonormal basis of their span instead.'
+
+_empty_error_description = \
+    'Cannot orthonormalize an empty set of Vectors. At least one Vector is needed.'
+
+# There are supposedly 480 tables that satisfy this requirement for 7 dimensions. We're going to be using only one
+# for the sake of brevity. Basically it's some black magic to do this in 7 dimensions, and we can rip off the first
+# three columns and rows to do it in 3.
+# TODO: Make this less wonky. Maybe default to this table but let the user define their own if they wish?
+_dimensionality_lookup = list()
+_dimensionality_lookup.append([[0, 0], [1, 2], [-1, 1], [1, 4], [-1, 3], [-1, 6], [1, 5]])
+_dimensionality_lookup.append([[-1, 2], [0, 1], [1, 0], [1, 5], [1, 6], [-1, 3], [-1, 4]])
+_dimensionality_lookup.append([[1, 1], [-1, 0], [0, 2], [1, 6], [-1, 5], [1, 4], [-1, 3]])
+_dimensionality_lookup.append([[-1, 4], [-1, 5], [-1, 6], [0, 3], [1, 0], [1, 1], [1, 2]])
+_dimensionality_lookup.append([[1, 3], [-1, 6], [1, 5], [-1, 0], [0, 4], [-1, 2], [1, 1]])
+_dimensionality_lookup.append([[1, 6], [1, 3], [-1, 4], [-1, 1], [1, 2], [0, 5], [-1, 0]])
+_dimensionality_lookup.append([[-1, 5], [1, 4], [1, 3], [-1, 2], [-1, 1], [1, 0], [0, 6]])
+
+
+def _cross_tensor(dimension) -> np.ndarray:
+    """Returns the lookup table as a (dimension, dimension, dimension) tensor, for cross products over whole batches."""
+    tensor = np.zeros((dimension, dimension, dimension))
+
+    for x in range(0, dimension):
+        for y in range(0, dimension):
+            tensor[x, y, _dimensionality_lookup[x][y][1]] = _dimensionality_lookup[x][y][0]
+
+    return tensor
+
 
 def _type_check(vector_1, vector_2):
     # Defer the type import so we don't get a circular reference. Anyhow, this is the only location we will need to
     # import Geometry to anyhow.
     from geometry.base import Geometry
 
-    type_repr_1 = str(type(vector_1))
-    type_repr_2 = str(type(vector_2))
+    # Sparse and dense Vectors with the same signature live in the same vector space, so they're allowed to mix
+    type_repr_1 = str(type(vector_1)).replace('SparseVector', 'Vector')
+    type_repr_2 = str(type(vector_2)).replace('SparseVector', 'Vector')
 
     if type_repr_1 != type_repr_2 \
             or Geometry not in vector_1.__class__.__bases__ \
@@ -30,10 +64,10 @@ def _type_check(vector_1, vector_2):
 def inner(vector_1, vector_2) -> complex:
     _type_check(vector_1, vector_2)
 
-    inner_product: complex = 0.0 + 0.0j
+    if sparse.is_sparse(vector_1) or sparse.is_sparse(vector_2):
+        return sparse.inner(vector_1, vector_2)
 
-    for i in range(0, vector_1.dimension):
-        inner_product += vector_1[i] * vector_2[i]
+    inner_product: complex = np.sum(vector_1._point._values * vector_2._point._values)
 
     return inner_product
 
@@ -46,19 +80,6 @@ def cross(vector_1, vector_2):
                         ' Non-trivial bilinear products of two vectors that are vector-valued, anticommutative and ' +
                         'orthogonal exist only in 3 and 7 dimensions.')
 
-    # There are supposedly 480 tables that satisfy this requirement for 7 dimensions. We're going to be using only one
-    # for the sake of brevity. Basically it's some black magic to do this in 7 dimensions, and we can rip off the first
-    # three columns and rows to do it in 3.
-    # TODO: Make this less wonky. Maybe default to this table but let the user define their own if they wish?
-    dimensionality_lookup = list()
-    dimensionality_lookup.append([[0, 0], [1, 2], [-1, 1], [1, 4], [-1, 3], [-1, 6], [1, 5]])
-    dimensionality_lookup.append([[-1, 2], [0, 1], [1, 0], [1, 5], [1, 6], [-1, 3], [-1, 4]])
-    dimensionality_lookup.append([[1, 1], [-1, 0], [0, 2], [1, 6], [-1, 5], [1, 4], [-1, 3]])
-    dimensionality_lookup.append([[-1, 4], [-1, 5], [-1, 6], [0, 3], [1, 0], [1, 1], [1, 2]])
-    dimensionality_lookup.append([[1, 3], [-1, 6], [1, 5], [-1, 0], [0, 4], [-1, 2], [1, 1]])
-    dimensionality_lookup.append([[1, 6], [1, 3], [-1, 4], [-1, 1], [1, 2], [0, 5], [-1, 0]])
-    dimensionality_lookup.append([[-1, 5], [1, 4], [1, 3], [-1, 2], [-1, 1], [1, 0], [0, 6]])
-
     cross_product = deepcopy(vector_1)
 
     for i in range(0, cross_product.dimension):
@@ -67,7 +88,8 @@ def cross(vector_1, vector_2):
     # Use the lookup to figure out what dimension we're supposed to be assigning to what
     for x in range(0, cross_product.dimension):
         for y in range(0, cross_product.dimension):
-            cross_product[dimensionality_lookup[x][y][1]] += vector_1[x] * vector_2[y] * dimensionality_lookup[x][y][0]
+            sign, index = _dimensionality_lookup[x][y]
+            cross_product[index] += vector_1[x] * vector_2[y] * sign
 
     return cross_product
 
@@ -80,3 +102,85 @@ def angle(vector_1, vector_2):
             'An angle between any Vector pair where one of the two has magnitude = 0 does not exist.')
 
     return np.arccos(inner(vector_1, vector_2) / (vector_1.norm() * vector_2.norm()))
+
+
+def _as_batch(vectors):
+    """Wraps a single Vector or an iterable of Vectors in a Batch, and checks that it holds Vectors at all."""
+    single = not isinstance(vectors, Batch) and hasattr(vectors, 'signature')
+
+    if not isinstance(vectors, Batch):
+        vectors = Batch.from_geometries([vectors] if single else vectors)
+
+    # A single check on the template covers the whole batch, since a Batch only ever holds one signature
+    _type_check(vectors._template, vectors._template)
+
+    return vectors, single
+
+
+def _orthonormal_columns(basis, tol) -> np.ndarray:
+    # The SVD gives us the rank and an orthonormal basis in one go. The left singular vectors are orthonormal under
+    # the Hermitian inner product, which is what projections of complex Vectors need.
+    u, s, _ = np.linalg.svd(basis.values.T, full_matrices=False)
+
+    if len(s) == 0 or s[0] == 0:
+        return u[:, :0]
+
+    return u[:, s > tol * s[0]]
+
+
+def orthonormalize(vectors, tol=1e-10):
+    """
+    Gram-Schmidt orthonormalization of a set of Vectors, computed for the whole set at once through a QR decomposition.
+
+    The result spans the same space and keeps the order of the input, in that the first k output Vectors span the
+    same space as the first k input Vectors. Complex Vectors are orthonormalized under the Hermitian inner product.
+    """
+    batch, single = _as_batch(vectors)
+
+    if len(batch) == 0:
+        raise ValueError(_empty_error_description)
+
+    q, r = np.linalg.qr(batch.values.T)
+    diagonal = np.diagonal(r)
+
+    if len(batch) > batch.dimension or np.any(np.abs(diagonal) <= tol * np.max(np.abs(diagonal))):
+        raise ValueError(_dependence_error_description)
+
+    # QR is only unique up to a phase per column, so rotate each column to match what Gram-Schmidt would give us
+    q = q * (diagonal / np.abs(diagonal))
+
+    return batch.geometry(q[:, 0]) if single else Batch(batch._template, q.T)
+
+
+def span(vectors, tol=1e-10):
+    """Returns a Batch holding an orthonormal basis of the space spanned by vectors, dropping any dependent ones."""
+    batch, _ = _as_batch(vectors)
+
+    return Batch(batch._template, _orthonormal_columns(batch, tol).T)
+
+
+def project(vectors, basis, tol=1e-10):
+    """
+    Projects every Vector in vectors onto the subspace spanned by basis.
+
+    The basis doesn't need to be orthonormal or independent. It gets reduced to an orthonormal basis once, and all of
+    the projections are then done in a single einsum over the batch. Signatures are checked once for the whole batch.
+    """
+    batch, single = _as_batch(vectors)
+    basis, _ = _as_batch(basis)
+    batch.check(basis)
+
+    q = _orthonormal_columns(basis, tol)
+    coefficients = np.einsum('dk,nd->nk', q.conj(), batch.values)
+    projected = np.einsum('dk,nk->nd', q, coefficients)
+
+    return batch.geometry(projected[0]) if single else Batch(batch._template, projected)
+
+
+def reject(vectors, basis, tol=1e-10):
+    """Returns the components of every Vector in vectors that are orthogonal to the subspace spanned by basis."""
+    batch, single = _as_batch(vectors)
+    projected = project(batch, basis, tol)
+    rejected = batch.values - projected.values
+
+    return batch.geometry(rejected[0]) if single else Batch(batch._template, rejected)
@@ -0,0 +1,307 @@
+import numpy as np
+from geometry.batch import Batch
+
+_dimensionality_error_description = \
+    'Convex hulls are only implemented for 2 and 3 dimensional Points, not for dimensionality %i.'
+
+_degenerate_error_description = \
+    'The Points are %s, so they have no %i dimensional convex hull.'
+
+
+def _as_batch(points) -> Batch:
+    batch = points if isinstance(points, Batch) else Batch.from_geometries(points)
+    type_repr = str(type(batch._template))
+
+    if type_repr[len(type_repr) - 7:len(type_repr) - 2] != 'Point':
+        raise TypeError('Hulls and bounding volumes are defined for Points, got %s.' % repr(batch))
+
+    # Same restriction as AABBs: there's no ordering, and so no notion of "outside", for complex coordinates
+    if np.any(batch.values.imag != 0):
+        raise ValueError('Hulls and bounding volumes can only be computed for Points with real coordinates.')
+
+    return batch
+
+
+def _tolerance(values) -> float:
+    return 1e-10 * max(1.0, float(np.max(np.abs(values))))
+
+
+def _cross_2d(a, b, points) -> np.ndarray:
+    return (b[0] - a[0]) * (points[:, 1] - a[1]) - (b[1] - a[1]) * (points[:, 0] - a[0])
+
+
+def _hull_2d(values) -> np.ndarray:
+    """Quickhull in 2D. Returns the indices of the hull vertices in counter-clockwise order."""
+    eps = _tolerance(values)
+    order = np.lexsort((values[:, 1], values[:, 0]))
+    lowest, highest = order[0], order[-1]
+
+    if np.all(np.abs(_cross_2d(values[lowest], values[highest], values)) <= eps):
+        raise ValueError(_degenerate_error_description % ('collinear', 2))
+
+    everything = np.arange(len(values))
+    hull = [lowest]
+
+    def outside(a, b, candidates):
+        # Points to the right of a -> b lie outside of that edge of a counter-clockwise polygon
+        return candidates[_cross_2d(values[a], values[b], values[candidates]) < -eps]
+
+    # Explicit stack of segments and vertices, unwound in order, so the output is counter-clockwise without recursion
+    stack = [('segment', highest, lowest, outside(highest, lowest, everything)), ('vertex', highest),
+             ('segment', lowest, highest, outside(lowest, highest, everything))]
+
+    while len(stack) > 0:
+        item = stack.pop()
+
+        if item[0] == 'vertex':
+            hull.append(item[1])
+            continue
+
+        _, a, b, candidates = item
+
+        if len(candidates) == 0:
+            continue
+
+        farthest = candidates[np.argmin(_cross_2d(values[a], values[b], values[candidates]))]
+        stack.append(('segment', farthest, b, outside(farthest, b, candidates)))
+        stack.append(('vertex', farthest))
+        stack.append(('segment', a, farthest, outside(a, farthest, candidates)))
+
+    return np.array(hull)
+
+
+def _face_planes(values, faces):
+    normals = np.cross(values[faces[:, 1]] - values[faces[:, 0]], values[faces[:, 2]] - values[faces[:, 0]])
+    offsets = np.sum(normals * values[faces[:, 0]], axis=1)
+
+    return normals, offsets
+
+
+def _initial_tetrahedron(values, eps) -> np.ndarray:
+    first = int(np.argmin(values[:, 0]))
+    second = int(np.argmax(np.sum((values - values[first]) ** 2, axis=1)))
+
+    line = values[second] - values[first]
+    third = int(np.argmax(np.sum(np.cross(line, values - values[first]) ** 2, axis=1)))
+
+    normal = np.cross(line, values[third] - values[first])
+
+    if np.linalg.norm(normal) <= eps:
+        raise ValueError(_degenerate_error_description % ('collinear', 3))
+
+    heights = (values - values[first]) @ normal
+    fourth = int(np.argmax(np.abs(heights)))
+
+    if np.abs(heights[fourth]) <= eps * np.linalg.norm(normal):
+        raise ValueError(_degenerate_error_description % ('coplanar', 3))
+
+    faces = np.array([[first, second, third], [first, third, fourth], [first, fourth, second],
+                      [second, fourth, third]])
+
+    # Flip every face so its normal points away from the inside of the tetrahedron
+    centroid = np.mean(values[[first, second, third, fourth]], axis=0)
+    normals, offsets = _face_planes(values, faces)
+    inward = normals @ centroid - offsets > 0
+    faces[inward] = faces[inward][:, [0, 2, 1]]
+
+    return faces
+
+
+def _hull_3d(values) -> np.ndarray:
+    """
+    Quickhull-style incremental hull in 3D. Returns (m, 3) triangles of indices into values, wound counter-clockwise
+    when seen from outside.
+
+    Every round adds the point farthest outside of the current hull, after which all points that ended up inside are
+    discarded in one vectorized pass, so the Python loop only runs about once per hull vertex.
+    """
+    eps = _tolerance(values)
+    faces = _initial_tetrahedron(values, eps)
+    remaining = np.arange(len(values))
+
+    while True:
+        normals, offsets = _face_planes(values, faces)
+        heights = (values[remaining] @ normals.T - offsets) / np.linalg.norm(normals, axis=1)
+        furthest_out = np.max(heights, axis=1)
+
+        remaining = remaining[furthest_out > eps]
+
+        if len(remaining) == 0:
+            return faces
+
+        apex = remaining[np.argmax(furthest_out[furthest_out > eps])]
+        visible = (normals @ values[apex] - offsets) / np.linalg.norm(normals, axis=1) > eps
+
+        # The horizon is made up of the edges of visible faces whose reversed edge isn't also on a visible face
+        edges = np.concatenate([faces[visible][:, [0, 1]], faces[visible][:, [1, 2]], faces[visible][:, [2, 0]]])
+        edge_set = set(map(tuple, edges))
+        horizon = np.array([edge for edge in edges if (edge[1], edge[0]) not in edge_set])
+
+        faces = np.concatenate([faces[~visible],
+                                np.column_stack([horizon, np.full(len(horizon), apex)])])
+        remaining = remaining[remaining != apex]
+
+
+def convex_hull(points):
+    """
+    Computes the convex hull of a Batch (or iterable) of 2D or 3D Points.
+
+    Returns the hull vertices as a Batch with the signature of the input, and the indices of those vertices in the
+    input. In 2D the vertices are in counter-clockwise order. In 3D a third value is returned: the (m, 3) triangular
+    faces of the hull as indices into the returned vertices, wound counter-clockwise when seen from outside.
+    """
+    batch = _as_batch(points)
+    values = batch.values.real
+
+    if batch.dimension == 2:
+        indices = _hull_2d(values)
+
+        return batch[indices], indices
+
+    if batch.dimension == 3:
+        faces = _hull_3d(values)
+        indices, faces = np.unique(faces, return_inverse=True)
+
+        return batch[indices], indices, faces.reshape(-1, 3)
+
+    raise TypeError(_dimensionality_error_description % batch.dimension)
+
+
+class IncrementalHull:
+    """
+    Convex hull of a stream of 2D or 3D Points that arrive a Batch at a time.
+
+    Only the current hull vertices are kept between updates, since no Point inside of the hull can ever be on a later
+    hull. Every update is then a hull of the current vertices together with the new Points.
+    """
+
+    def __init__(self, template):
+        self._vertices = Batch(template)
+        self._faces = None
+
+        if template.dimension not in (2, 3):
+            raise TypeError(_dimensionality_error_description % template.dimension)
+
+    @property
+    def vertices(self) -> Batch:
+        return self._vertices
+
+    @property
+    def faces(self):
+        """Triangles of the 3D hull as indices into vertices, or None in 2D."""
+        return self._faces
+
+    def update(self, points):
+        batch = _as_batch(points)
+        self._vertices.check(batch)
+
+        combined = Batch(self._vertices._template, np.concatenate([self._vertices.values, batch.values]))
+
+        # Not enough points for a hull yet, so just hold on to all of them until there are
+        if len(combined) <= self._vertices.dimension:
+            self._vertices = combined
+            return self
+
+        try:
+            result = convex_hull(combined)
+        except ValueError:
+            # Degenerate so far (e.g. all collinear), keep everything until the points span the space
+            self._vertices = combined
+            return self
+
+        self._vertices = result[0]
+        self._faces = result[2] if self._vertices.dimension == 3 else None
+
+        return self
+
+
+def bounding_box(points):
+    """Returns the smallest AABB that contains every Point in a Batch (or iterable)."""
+    from geometry.base import AABB
+
+    batch = _as_batch(points)
+
+    return AABB(batch.geometry(np.min(batch.values.real, axis=0)), batch.geometry(np.max(batch.values.real, axis=0)))
+
+
+def _circumsphere(boundary):
+    """Smallest sphere with every point of boundary (at most dimension + 1 of them) on its surface."""
+    if len(boundary) == 0:
+        return None, -1.0
+
+    boundary = np.array(boundary)
+    origin = boundary[0]
+    spans = boundary[1:] - origin
+
+    if len(spans) == 0:
+        return origin, 0.0
+
+    # The center lies in the affine hull of the boundary: c = origin + spans^T l, with |c - p_i| = |c - origin|
+    weights = np.linalg.lstsq(2.0 * spans @ spans.T, np.sum(spans ** 2, axis=1), rcond=None)[0]
+    center = origin + spans.T @ weights
+
+    return center, float(np.sum((center - origin) ** 2))
+
+
+def _welzl(values, boundary, eps):
+    center, squared_radius = _circumsphere(boundary)
+
+    if len(boundary) == values.shape[1] + 1:
+        return center, squared_radius
+
+    start = 0
+
+    while True:
+        # Vectorized scan for the next point outside of the current sphere, instead of testing points one by one
+        if center is None:
+            outside = np.arange(start, len(values))
+        else:
+            squared_distances = np.sum((values[start:] - center) ** 2, axis=1)
+            outside = start + np.flatnonzero(squared_distances > squared_radius + eps * eps)
+
+        if len(outside) == 0:
+            return center, squared_radius
+
+        i = outside[0]
+        center, squared_radius = _welzl(values[:i], boundary + [values[i]], eps)
+        start = i + 1
+
+
+def bounding_sphere(points, method='welzl', rng=None):
+    """
+    Computes a bounding sphere of a Batch (or iterable) of Points in any number of dimensions.
+
+    method='welzl' gives the exact minimal sphere (Welzl's algorithm on randomly shuffled Points), method='ritter'
+    gives a slightly larger sphere much faster, by repeatedly growing a sphere to include the Point farthest outside
+    of it. Returns the center as a Point with the signature of the input, and the radius.
+    """
+    batch = _as_batch(points)
+    values = batch.values.real
+
+    if method == 'ritter':
+        start = values[0]
+        first = values[np.argmax(np.sum((values - start) ** 2, axis=1))]
+        second = values[np.argmax(np.sum((values - first) ** 2, axis=1))]
+
+        center = (first + second) / 2.0
+        radius = np.sqrt(np.sum((second - first) ** 2)) / 2.0
+
+        while True:
+            distances = np.sqrt(np.sum((values - center) ** 2, axis=1))
+            farthest = int(np.argmax(distances))
+
+            if distances[farthest] <= radius * (1.0 + 1e-12):
+                return batch.geometry(center), float(radius)
+
+            # Grow just enough to touch the farthest point, keeping the opposite side of the sphere where it was
+            new_radius = (radius + distances[farthest]) / 2.0
+            center = center + (values[farthest] - center) * (new_radius - radius) / distances[farthest]
+            radius = new_radius
+
+    if method != 'welzl':
+        raise ValueError('Unknown method %s. Use either \'welzl\' or \'ritter\'.' % method)
+
+    rng = np.random.default_rng() if rng is None else rng
+    center, squared_radius = _welzl(values[rng.permutation(len(values))], [], _tolerance(values))
+
+    return batch.geometry(center), float(np.sqrt(squared_radius))
@@ -0,0 +1,250 @@
+import os
+import numpy as np
+from geometry.batch import Batch, template
+
+_metric_error_description = \
+    'Unknown metric %s. Use \'angle\' for random-hyperplane hashing or \'euclidean\' for p-stable hashing.'
+
+
+def _as_batch(geometries):
+    if isinstance(geometries, Batch):
+        return geometries
+
+    if hasattr(geometries, 'signature'):
+        return Batch.from_geometries([geometries])
+
+    return Batch.from_geometries(geometries)
+
+
+def _npz_path(path) -> str:
+    # np.savez adds the extension when it's missing but np.load doesn't, so both sides agree on the full name here
+    path = os.fspath(path)
+
+    return path if path.endswith('.npz') else path + '.npz'
+
+
+# Number of (query, candidate) pairs re-ranked at once, which bounds the memory of the gathered coordinates
+_pair_block_size = 65536
+
+
+class LSHIndex:
+    """
+    Approximate nearest-neighbour index for large collections of same-signature Points or Vectors.
+
+    Exact search structures stop paying off beyond a few dozen dimensions, so this index uses locality-sensitive
+    hashing instead. With metric='angle', every table hashes a vector by which side of n_bits random hyperplanes it
+    falls on, so vectors a small angle() apart tend to collide. With metric='euclidean', every table uses n_bits
+    p-stable (Gaussian) projections quantized into buckets of width bucket_width.
+
+    More tables (n_tables) raise recall, and more bits per table (n_bits) make buckets smaller and queries faster at
+    the cost of recall. Candidates found in the tables are always re-ranked with the exact metric. Complex coordinates
+    are hashed through their real and imaginary parts.
+
+    Like Batch, the index is a collection and not a base geometry, so it doesn't inherit from Geometry.
+    """
+
+    def __init__(self, template, n_tables=8, n_bits=16, metric='angle', bucket_width=4.0, seed=None):
+        if metric not in ('angle', 'euclidean'):
+            raise ValueError(_metric_error_description % metric)
+
+        if metric == 'angle' and n_bits > 62:
+            raise ValueError('Random-hyperplane keys are packed into 64 bit integers, so n_bits must be 62 or less.')
+
+        self._points = Batch(template)
+        self._chunks = []
+        self._key_chunks = []
+        self.metric = metric
+        self.bucket_width = float(bucket_width)
+
+        rng = np.random.default_rng(seed)
+        features = 2 * template.dimension
+
+        self._projections = rng.standard_normal((n_tables, features, n_bits))
+        self._offsets = rng.uniform(0.0, self.bucket_width, (n_tables, n_bits))
+        self._mixing = rng.integers(1, 2 ** 31, (n_tables, n_bits), dtype=np.int64)
+
+        self._keys = np.empty((n_tables, 0), dtype=np.int64)
+        self._order = None
+
+    @property
+    def dimension(self):
+        return self._points.dimension
+
+    @property
+    def signature(self):
+        return self._points.signature
+
+    @property
+    def n_tables(self):
+        return self._projections.shape[0]
+
+    @property
+    def n_bits(self):
+        return self._projections.shape[2]
+
+    def __len__(self):
+        return len(self._points) + sum(len(chunk) for chunk in self._chunks)
+
+    def _hash(self, values) -> np.ndarray:
+        """Returns the (n_tables, n) array of bucket keys for an (n, dimension) array of coordinates."""
+        features = np.concatenate([values.real, values.imag], axis=1)
+        # One matrix product per table, which goes through BLAS where einsum wouldn't
+        projected = np.matmul(features[np.newaxis], self._projections)
+
+        if self.metric == 'angle':
+            return (projected > 0).astype(np.int64) @ (np.int64(1) << np.arange(self.n_bits, dtype=np.int64))
+
+        buckets = np.floor((projected + self._offsets[:, np.newaxis, :]) / self.bucket_width).astype(np.int64)
+
+        # Integer overflow here just wraps around, which is perfectly fine for a hash
+        return np.einsum('tnb,tb->tn', buckets, self._mixing)
+
+    def _consolidate(self):
+        # Insertions are buffered as chunks so that adding many small batches doesn't copy the whole index every time
+        if len(self._chunks) > 0:
+            self._points = Batch(self._points.template, np.concatenate([self._points.values] + self._chunks))
+            self._keys = np.concatenate([self._keys] + self._key_chunks, axis=1)
+            self._chunks = []
+            self._key_chunks = []
+
+        if self._order is None:
+            self._order = np.argsort(self._keys, axis=1, kind='stable')
+            self._sorted_keys = np.take_along_axis(self._keys, self._order, axis=1)
+            self._norms = np.sqrt(np.einsum('nd,nd->n', self._points.values, self._points.values))
+
+    def add(self, geometries) -> np.ndarray:
+        """Inserts a Batch (or iterable, or single geometry) and returns the indices the new entries were given."""
+        batch = _as_batch(geometries)
+        self._points.check(batch)
+
+        start = len(self)
+        self._chunks.append(np.array(batch.values))
+        self._key_chunks.append(self._hash(batch.values))
+        self._order = None
+
+        return np.arange(start, start + len(batch))
+
+    def _distances(self, queries, query_ids, candidates) -> np.ndarray:
+        """Distances between queries[query_ids] and the stored geometry at candidates, pair by pair."""
+        values = self._points.values
+        distances = np.empty(len(candidates))
+        query_norms = np.sqrt(np.einsum('nd,nd->n', queries, queries))
+
+        for start in range(0, len(candidates), _pair_block_size):
+            pair_queries = queries[query_ids[start:start + _pair_block_size]]
+            pair_values = values[candidates[start:start + _pair_block_size]]
+
+            if self.metric == 'euclidean':
+                difference = pair_values - pair_queries
+                squared = np.einsum('pd,pd->p', difference, difference.conj()).real
+                distances[start:start + _pair_block_size] = np.sqrt(squared)
+                continue
+
+            # Same bilinear inner product and norms as geometry.functions.vector.angle
+            norms = self._norms[candidates[start:start + _pair_block_size]] * \
+                query_norms[query_ids[start:start + _pair_block_size]]
+            cosine = np.divide(np.einsum('pd,pd->p', pair_values, pair_queries), norms,
+                               out=np.zeros(len(norms), dtype=complex), where=norms != 0)
+            distances[start:start + _pair_block_size] = np.arccos(np.clip(cosine.real, -1.0, 1.0))
+
+        return distances
+
+    def _candidates(self, keys):
+        """
+        Returns every distinct (query, candidate) pair that shares a bucket in at least one table, as two arrays.
+
+        Buckets are found for every query in every table at once by binary search on the sorted keys, and then expanded
+        into pairs with repeat and cumsum, so there is no loop over queries.
+        """
+        n_queries = keys.shape[1]
+        pairs = []
+
+        for t in range(0, self.n_tables):
+            lows = np.searchsorted(self._sorted_keys[t], keys[t], side='left')
+            counts = np.searchsorted(self._sorted_keys[t], keys[t], side='right') - lows
+
+            query_ids = np.repeat(np.arange(n_queries), counts)
+            # Position of every pair within its bucket, added to where that bucket starts in the sorted keys
+            within = np.arange(len(query_ids)) - np.repeat(np.cumsum(counts) - counts, counts)
+
+            pairs.append(query_ids * len(self._points) + self._order[t, np.repeat(lows, counts) + within])
+
+        pairs = np.unique(np.concatenate(pairs))
+
+        return pairs // len(self._points), pairs % len(self._points)
+
+    def query(self, geometries, k=1, block_size=1024):
+        """
+        Finds the approximate k nearest neighbours of every query geometry.
+
+        Returns a pair of (queries, k) arrays: the indices of the neighbours in insertion order, and their distances
+        (angles in radians for metric='angle'). Queries with fewer than k candidates are padded with -1 and inf.
+        Queries are processed block_size at a time, with candidate gathering, re-ranking and the top k selection each
+        vectorized over the whole block. Memory grows with the number of (query, candidate) pairs in a block, so a
+        smaller block_size helps when buckets are very full (few bits, or heavily clustered data).
+        """
+        batch = _as_batch(geometries)
+        self._points.check(batch)
+        self._consolidate()
+
+        indices = np.full((len(batch), k), -1, dtype=np.int64)
+        distances = np.full((len(batch), k), np.inf)
+
+        if len(self._points) == 0:
+            return indices, distances
+
+        for start in range(0, len(batch), block_size):
+            block = batch.values[start:start + block_size]
+            query_ids, candidates = self._candidates(self._hash(block))
+            candidate_distances = self._distances(block, query_ids, candidates)
+
+            # Pairs come out of _candidates sorted by query and then by candidate, so two stable sorts order them by
+            # query and then by distance, with ties going to the earliest inserted candidate
+            order = np.argsort(candidate_distances, kind='stable')
+            order = order[np.argsort(query_ids[order], kind='stable')]
+            query_ids, candidates, candidate_distances = \
+                query_ids[order], candidates[order], candidate_distances[order]
+
+            first = np.searchsorted(query_ids, query_ids, side='left')
+            rank = np.arange(len(query_ids)) - first
+            kept = rank < k
+
+            indices[start + query_ids[kept], rank[kept]] = candidates[kept]
+            distances[start + query_ids[kept], rank[kept]] = candidate_distances[kept]
+
+        return indices, distances
+
+    def __getitem__(self, key):
+        self._consolidate()
+
+        return self._points[key]
+
+    def save(self, path):
+        """Writes the index, including its stored geometry, to a .npz file at path."""
+        self._consolidate()
+
+        saved_template = self._points.template
+        kind = 'Vector' if hasattr(saved_template, '_point') else 'Point'
+
+        np.savez(_npz_path(path), values=self._points.values, keys=self._keys, projections=self._projections,
+                 offsets=self._offsets, mixing=self._mixing, metric=self.metric, bucket_width=self.bucket_width,
+                 kind=kind, dimension=saved_template.dimension, names=np.array(dir(saved_template), dtype=str))
+
+    @classmethod
+    def load(cls, path):
+        """Reads an index written by save() back in, without rehashing any of the stored geometry."""
+        with np.load(_npz_path(path)) as data:
+            # Signatures are built from Python's salted string hashes, so they can't be written to disk and compared
+            # in another process. Instead we store the layout of the geometry and rebuild an equivalent template.
+            stored_template = template(int(data['dimension']), tuple(str(n) for n in data['names']),
+                                       vector=str(data['kind']) == 'Vector')
+
+            index = cls(stored_template, n_tables=data['projections'].shape[0], n_bits=data['projections'].shape[2],
+                        metric=str(data['metric']), bucket_width=float(data['bucket_width']))
+            index._projections = data['projections']
+            index._offsets = data['offsets']
+            index._mixing = data['mixing']
+            index._keys = data['keys']
+            index._points = Batch(stored_template, data['values'])
+
+        return index
@@ -0,0 +1,212 @@
+import ast
+import gc
+import os
+import sys
+import tracemalloc
+import types
+import numpy as np
+from functools import lru_cache
+
+_package_directory = os.path.dirname(os.path.abspath(__file__))
+
+# Functions defined by the operator factories that implement arithmetic, as opposed to comparison, hashing, etc.
+_arithmetic_functions = {'add', 'radd', 'sub', 'rsub', 'mul', 'rmul', 'truediv', 'rtruediv', 'neg', 'inv'}
+
+_components = ('instance', '__dict__', 'class', 'closures', 'wrapped', 'arrays', 'other')
+
+
+def _is_geometry(obj) -> bool:
+    from geometry.base import Geometry
+
+    return isinstance(obj, Geometry)
+
+
+def _is_dynamic_class(obj) -> bool:
+    # Every Point, Vector, etc. gets its own class, created by type() in geometry.base. Those are part of the cost of
+    # the object. Geometry itself, and every other class, is shared and isn't counted.
+    from geometry.base import Geometry
+
+    return isinstance(obj, type) and obj is not Geometry and issubclass(obj, Geometry)
+
+
+def _category(obj, parent):
+    if isinstance(obj, np.ndarray):
+        return 'arrays'
+
+    if isinstance(obj, (types.FunctionType, types.CellType)):
+        return 'closures'
+
+    if _is_dynamic_class(obj) or isinstance(obj, property):
+        return 'class'
+
+    if _is_geometry(obj):
+        return 'wrapped'
+
+    return parent
+
+
+def _referents(obj) -> list:
+    if isinstance(obj, (types.ModuleType, types.CodeType)) or (isinstance(obj, type) and not _is_dynamic_class(obj)):
+        return []
+
+    if isinstance(obj, types.FunctionType):
+        # Globals and code are shared by every function the factory ever made, so only the closure is per-object
+        return [cell for cell in (obj.__closure__ or ())] + \
+            [value for value in (obj.__defaults__, obj.__kwdefaults__, obj.__dict__) if value]
+
+    if isinstance(obj, np.ndarray):
+        # Views keep their base array alive, so the base counts towards whoever holds the view
+        return [obj.base] if obj.base is not None else []
+
+    return gc.get_referents(obj)
+
+
+def _walk(root, breakdown, seen, root_category='instance'):
+    """Adds the size of everything reachable from root, and not already in seen, into breakdown by component."""
+    stack = [(root, root_category)]
+
+    while len(stack) > 0:
+        obj, category = stack.pop()
+
+        if id(obj) in seen or isinstance(obj, (types.ModuleType, types.CodeType)):
+            continue
+
+        if isinstance(obj, type) and not _is_dynamic_class(obj):
+            continue
+
+        seen.add(id(obj))
+        breakdown[category] += sys.getsizeof(obj)
+
+        instance_dict = getattr(obj, '__dict__', None) if _is_geometry(obj) or obj is root else None
+
+        for referent in _referents(obj):
+            if referent is instance_dict and category == 'instance':
+                stack.append((referent, '__dict__'))
+            else:
+                stack.append((referent, _category(referent, category)))
+
+
+def deep_size(obj) -> dict:
+    """
+    Reports how many bytes a geometry object, Batch or collection of geometry really takes up, by component.
+
+    The components are the object itself ('instance'), its '__dict__', its dynamically created 'class' (including the
+    class dictionary and its properties), the 'closures' created by the function factories, 'wrapped' geometry (such as
+    the Point inside of a Vector), numpy 'arrays', and everything else ('other'). Anything shared between objects is
+    only counted once. Lists, tuples, sets and dicts of geometry are reported as the sum of their elements, with the
+    container itself under 'other'. The total is under 'total'.
+    """
+    breakdown = {component: 0 for component in _components}
+    seen = set()
+
+    if isinstance(obj, (list, tuple, set, frozenset, dict)) and not _is_geometry(obj):
+        elements = obj.values() if isinstance(obj, dict) else obj
+        breakdown['other'] += sys.getsizeof(obj)
+        seen.add(id(obj))
+
+        for element in elements:
+            _walk(element, breakdown, seen)
+    else:
+        _walk(obj, breakdown, seen)
+
+    breakdown['total'] = sum(breakdown[component] for component in _components)
+
+    return breakdown
+
+
+@lru_cache(maxsize=None)
+def _functions(filename) -> tuple:
+    """Returns (first line, last line, name) for every function in a file, innermost functions last."""
+    with open(filename) as source:
+        tree = ast.parse(source.read())
+
+    functions = [(node.lineno, node.end_lineno, node.name) for node in ast.walk(tree)
+                 if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))]
+
+    return tuple(sorted(functions, key=lambda f: (f[0], -f[1])))
+
+
+def _function_at(filename, lineno) -> str:
+    name = '<module>'
+
+    # Sorted by start line with enclosing functions first, so the last match is the innermost function
+    for first, last, function in _functions(filename):
+        if first <= lineno <= last:
+            name = function
+
+    return name
+
+
+def _operation(traceback) -> str:
+    """Names the library operation an allocation belongs to, after the outermost geometry frame it came through."""
+    for frame in traceback:
+        filename = os.path.abspath(frame.filename)
+
+        if not filename.startswith(_package_directory) or filename == os.path.abspath(__file__):
+            continue
+
+        relative = os.path.relpath(filename, _package_directory)
+        module = os.path.splitext(relative)[0].replace(os.sep, '.')
+        function = _function_at(filename, frame.lineno)
+
+        if module == 'base':
+            return 'construction'
+
+        if module.startswith('factories.'):
+            if function in _arithmetic_functions:
+                return 'arithmetic'
+
+            # Code that runs in the factories themselves, rather than in what they return, runs at construction time
+            return 'construction' if function.endswith('_factory') else 'access'
+
+        return '%s.%s' % (module.split('.')[-1], function)
+
+    return 'other'
+
+
+class track:
+    """
+    Context manager that attributes the memory allocated inside of it to library operations, through tracemalloc.
+
+    Allocations are grouped by the outermost geometry function they came through: 'construction' for building
+    geometry, 'arithmetic' for the Vector operators, 'access' for indexing and attributes, '<module>.<function>' for
+    everything else in the library (e.g. 'vector.cross'), and 'other' for allocations made outside of the library. Only
+    memory still allocated when the block exits is counted.
+
+        with memory.track() as tracker:
+            points = [Point(x, 0) for x in range(1000)]
+
+        tracker.report  # {'construction': {'bytes': ..., 'blocks': ...}}
+    """
+
+    def __init__(self, frames=32):
+        self.frames = frames
+        self.report = {}
+        self._started = False
+        self._before = None
+
+    def __enter__(self):
+        self._started = not tracemalloc.is_tracing()
+
+        if self._started:
+            tracemalloc.start(self.frames)
+
+        self._before = tracemalloc.take_snapshot()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        after = tracemalloc.take_snapshot()
+
+        if self._started:
+            tracemalloc.stop()
+
+        for stat in after.compare_to(self._before, 'traceback'):
+            if stat.size_diff == 0:
+                continue
+
+            entry = self.report.setdefault(_operation(stat.traceback), {'bytes': 0, 'blocks': 0})
+            entry['bytes'] += stat.size_diff
+            entry['blocks'] += stat.count_diff
+
+        return False
@@ -0,0 +1,215 @@
+import asyncio
+import time
+from copy import deepcopy
+import numpy as np
+from geometry.batch import Batch
+
+_signature_error_description = \
+    'Signature mismatch in pipeline stage %s. Every Batch passed through a stage has to share the signature of the ' + \
+    'first one, to prevent mixing geometry from different vector spaces or coordinate systems.'
+
+# Marks the end of the stream as it is passed from one stage's queue to the next
+_END = object()
+
+
+class Stage:
+    """
+    One step of a Pipeline, applying function to every Batch that passes through it.
+
+    Stages are synchronous functions, so anything CPU-heavy should be run with offload=True, which hands every call to
+    executor (or the event loop's default executor when executor is None) and keeps the event loop free to ingest more
+    data in the meantime. Every stage checks that all of its input Batches share one signature, and keeps track of how
+    many Batches and items it processed and how long that took.
+    """
+
+    def __init__(self, function, name=None, offload=False, executor=None):
+        self.function = function
+        self.name = getattr(function, '__name__', 'stage') if name is None else name
+        self.offload = offload
+        self.executor = executor
+
+        self._signature = None
+        self._batches = 0
+        self._items = 0
+        self._busy = 0.0
+        self._max_latency = 0.0
+
+    def _apply(self, batch):
+        """Returns what should be passed on to the next stage for batch, or None to pass nothing on."""
+        return self.function(batch)
+
+    def _finish(self) -> list:
+        """Returns anything that should be passed on to the next stage once the input has run out."""
+        return []
+
+    def _reset(self):
+        """Called at the start of every run, so one run's signature (or state) doesn't carry over into the next."""
+        self._signature = None
+
+    async def process(self, batch):
+        if isinstance(batch, Batch):
+            if self._signature is None:
+                self._signature = batch.signature
+            elif batch.signature != self._signature:
+                raise TypeError(_signature_error_description % self.name)
+
+        start = time.perf_counter()
+
+        if self.offload:
+            result = await asyncio.get_running_loop().run_in_executor(self.executor, self._apply, batch)
+        else:
+            result = self._apply(batch)
+
+        latency = time.perf_counter() - start
+
+        self._batches += 1
+        self._items += len(batch) if hasattr(batch, '__len__') else 1
+        self._busy += latency
+        self._max_latency = max(self._max_latency, latency)
+
+        return result
+
+    @property
+    def metrics(self) -> dict:
+        """Batches and items processed, time spent processing them, throughput in items/s and latency per Batch."""
+        return {
+            'batches': self._batches,
+            'items': self._items,
+            'busy_seconds': self._busy,
+            'throughput': self._items / self._busy if self._busy > 0 else 0.0,
+            'mean_latency': self._busy / self._batches if self._batches > 0 else 0.0,
+            'max_latency': self._max_latency,
+        }
+
+    def __repr__(self):
+        return '<%s %s>' % (type(self).__name__, self.name)
+
+
+class Map(Stage):
+    """Replaces every Batch with function(batch). Returning None drops the Batch."""
+    pass
+
+
+class Filter(Stage):
+    """Keeps the elements of every Batch for which function(batch) gives True, as a boolean array over the Batch."""
+
+    def _apply(self, batch):
+        kept = batch[np.asarray(self.function(batch), dtype=bool)]
+
+        # Empty Batches are dropped rather than passed on, so later stages don't spend time on them
+        return kept if len(kept) > 0 else None
+
+
+class Reduce(Stage):
+    """
+    Folds every Batch into an accumulated value with state = function(state, batch), starting from initial.
+
+    Nothing is passed on until the input runs out, at which point the final state is passed on as a single item. Every
+    run of a Pipeline starts over from a fresh copy of initial.
+    """
+
+    def __init__(self, function, initial, name=None, offload=False, executor=None):
+        Stage.__init__(self, function, name, offload, executor)
+        self.initial = initial
+        self.state = deepcopy(initial)
+
+    def _apply(self, batch):
+        self.state = self.function(self.state, batch)
+
+        return None
+
+    def _finish(self) -> list:
+        return [self.state]
+
+    def _reset(self):
+        Stage._reset(self)
+        self.state = deepcopy(self.initial)
+
+
+class Pipeline:
+    """
+    Chains Stages together with bounded asyncio queues between them.
+
+    Every stage runs as its own task, and a queue holds at most maxsize items, so a slow stage makes the stages before
+    it (and ultimately the source) wait instead of letting memory grow without bound.
+    """
+
+    def __init__(self, *stages, maxsize=8):
+        self.stages = list(stages)
+        self.maxsize = maxsize
+
+    async def _produce(self, source, queue):
+        if hasattr(source, '__aiter__'):
+            async for batch in source:
+                await queue.put(batch)
+        else:
+            for batch in source:
+                await queue.put(batch)
+
+        await queue.put(_END)
+
+    @staticmethod
+    async def _run_stage(stage, inbox, outbox):
+        while True:
+            item = await inbox.get()
+
+            if item is _END:
+                for result in stage._finish():
+                    await outbox.put(result)
+
+                await outbox.put(_END)
+                return
+
+            result = await stage.process(item)
+
+            if result is not None:
+                await outbox.put(result)
+
+    async def stream(self, source):
+        """
+        Pushes source (an iterable or async iterable of Batches) through every stage, yielding the results as they
+        come out of the last one. An exception in any stage stops the pipeline and is raised from here.
+        """
+        for stage in self.stages:
+            stage._reset()
+
+        queues = [asyncio.Queue(self.maxsize) for _ in range(0, len(self.stages) + 1)]
+        tasks = {asyncio.ensure_future(self._produce(source, queues[0]))}
+        tasks.update(asyncio.ensure_future(self._run_stage(stage, queues[i], queues[i + 1]))
+                     for i, stage in enumerate(self.stages))
+
+        try:
+            while True:
+                getter = asyncio.ensure_future(queues[-1].get())
+                done, _ = await asyncio.wait(tasks | {getter}, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done - {getter}:
+                    tasks.discard(task)
+
+                    if task.exception() is not None:
+                        getter.cancel()
+                        raise task.exception()
+
+                if getter not in done:
+                    getter.cancel()
+                    continue
+
+                item = getter.result()
+
+                if item is _END:
+                    return
+
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run(self, source) -> list:
+        """Runs the whole pipeline over source and returns everything that came out of it as a list."""
+        return [item async for item in self.stream(source)]
+
+    @property
+    def metrics(self) -> dict:
+        return {stage.name: stage.metrics for stage in self.stages}
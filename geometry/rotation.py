@@ -0,0 +1,186 @@
+import numpy as np
+from geometry.batch import Batch
+from geometry.functions import vector
+
+_dimensionality_error_description = \
+    'This rotation acts on %i dimensional Vectors, but was given Vectors with dimensionality %i.'
+
+_count_error_description = \
+    'A rotation holding %i elements can only be applied to a single Vector or to a Batch of the same length, ' + \
+    'not to a Batch of %i Vectors.'
+
+
+def _as_batch(vectors, dimension):
+    batch, single = vector._as_batch(vectors)
+
+    if batch.dimension != dimension:
+        raise TypeError(_dimensionality_error_description % (dimension, batch.dimension))
+
+    return batch, single
+
+
+def _check_count(count, batch):
+    if count != 1 and count != len(batch):
+        raise ValueError(_count_error_description % (count, len(batch)))
+
+
+def octonion_multiply(octonion_1, octonion_2) -> np.ndarray:
+    """
+    Multiplies two (..., 8) arrays of octonions, real part first, broadcasting over the leading axes.
+
+    The product is built from the same 7 dimensional cross product table that geometry.functions.vector.cross uses,
+    through (a + u)(b + v) = ab - u.v + av + bu + u x v, so the two always agree with each other.
+    """
+    a, u = octonion_1[..., 0], octonion_1[..., 1:]
+    b, v = octonion_2[..., 0], octonion_2[..., 1:]
+
+    real = a * b - np.sum(u * v, axis=-1)
+    imaginary = a[..., np.newaxis] * v + b[..., np.newaxis] * u + \
+        np.einsum('...x,...y,xyk->...k', u, v, vector._cross_tensor(7))
+
+    return np.concatenate([real[..., np.newaxis], imaginary], axis=-1)
+
+
+class Quaternion:
+    """
+    A batch of 3 dimensional rotations stored as an (n, 4) array of quaternions (w, x, y, z).
+
+    Composition is a single vectorized Hamilton product, and rotating a Batch of 3D Vectors is a single pass over its
+    storage, with either one quaternion for the whole Batch or one per Vector. Rotations don't care about the names of
+    the dimensions, so any 3D Vector signature can be rotated, and the signature is preserved.
+    """
+
+    def __init__(self, values):
+        self._values = np.array(values, dtype=float).reshape(-1, 4)
+
+    @classmethod
+    def from_axis_angle(cls, axes, angles):
+        """Rotations by angles (in radians) around axes, which may be a single 3D Vector or a Batch of them."""
+        axes, _ = _as_batch(axes, 3)
+        angles = np.atleast_1d(np.asarray(angles, dtype=float))
+
+        norms = np.linalg.norm(axes.values.real, axis=1)
+
+        if np.any(np.isclose(norms, 0.0)):
+            raise ZeroDivisionError('A rotation around an axis with magnitude = 0 does not exist.')
+
+        unit_axes = axes.values.real / norms[:, np.newaxis]
+        half = angles[:, np.newaxis] / 2.0
+
+        return cls(np.concatenate([np.cos(half), np.sin(half) * unit_axes], axis=1))
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values
+
+    def __len__(self):
+        return self._values.shape[0]
+
+    def __getitem__(self, key):
+        return Quaternion(self._values[key])
+
+    def __repr__(self):
+        return '<Quaternion batch of %i>' % len(self)
+
+    def normalize(self):
+        """Returns these rotations with every quaternion scaled back to unit length, e.g. after many compositions."""
+        return Quaternion(self._values / np.linalg.norm(self._values, axis=1)[:, np.newaxis])
+
+    def conjugate(self):
+        return Quaternion(self._values * np.array([1.0, -1.0, -1.0, -1.0]))
+
+    def inverse(self):
+        return Quaternion(self.conjugate().values / np.sum(self._values ** 2, axis=1)[:, np.newaxis])
+
+    def __mul__(self, other):
+        # (self * other) rotates by other first, then by self, the same way matrix products compose
+        w1, v1 = self._values[:, :1], self._values[:, 1:]
+        w2, v2 = other.values[:, :1], other.values[:, 1:]
+
+        return Quaternion(np.concatenate([w1 * w2 - np.sum(v1 * v2, axis=1, keepdims=True),
+                                          w1 * v2 + w2 * v1 + np.cross(v1, v2)], axis=1))
+
+    def matrix(self) -> np.ndarray:
+        """Returns the (n, 3, 3) rotation matrices of these quaternions."""
+        w, x, y, z = self.normalize().values.T
+
+        return np.stack([
+            np.stack([1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)], axis=-1),
+            np.stack([2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)], axis=-1),
+            np.stack([2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)], axis=-1)], axis=1)
+
+    def rotate(self, vectors):
+        """Rotates a single 3D Vector or a Batch of them, and returns the result in the same form."""
+        batch, single = _as_batch(vectors, 3)
+        _check_count(len(self), batch)
+
+        unit = self.normalize().values
+        w, q = unit[:, :1], unit[:, 1:]
+
+        # v' = v + w t + q x t with t = 2 q x v, which is the sandwich product q v q* without building quaternions
+        t = 2.0 * np.cross(q, batch.values)
+        rotated = batch.values + w * t + np.cross(q, t)
+
+        return batch.geometry(rotated[0]) if single else Batch(batch._template, rotated)
+
+
+class OctonionRotation:
+    """
+    A batch of 7 dimensional rotations built from unit octonions.
+
+    Conjugating an imaginary octonion x by a unit octonion u, x -> u x u*, is a rotation of the 7 dimensional space of
+    imaginary octonions. Octonions aren't associative, so unlike quaternions the composition of two such rotations
+    is not a conjugation by the product of their octonions. Rotations are therefore stored as (n, 7, 7) matrices, which
+    compose by matrix products and apply to Batches of 7D Vectors in one einsum.
+    """
+
+    def __init__(self, matrices):
+        self._matrices = np.array(matrices, dtype=float).reshape(-1, 7, 7)
+
+    @classmethod
+    def from_octonions(cls, octonions):
+        """The rotations x -> u x u* for an (n, 8) array of octonions u, real part first, normalized to unit length."""
+        octonions = np.array(octonions, dtype=float).reshape(-1, 8)
+        octonions = octonions / np.linalg.norm(octonions, axis=1)[:, np.newaxis]
+        conjugates = octonions * np.concatenate([[1.0], -np.ones(7)])
+
+        # Columns of the matrix are the images of the 7 imaginary basis octonions
+        basis = np.concatenate([np.zeros((7, 1)), np.eye(7)], axis=1)
+        images = octonion_multiply(octonion_multiply(octonions[:, np.newaxis, :], basis), conjugates[:, np.newaxis, :])
+
+        return cls(np.swapaxes(images[:, :, 1:], 1, 2))
+
+    @property
+    def matrices(self) -> np.ndarray:
+        return self._matrices
+
+    def __len__(self):
+        return self._matrices.shape[0]
+
+    def __getitem__(self, key):
+        return OctonionRotation(self._matrices[key])
+
+    def __repr__(self):
+        return '<OctonionRotation batch of %i>' % len(self)
+
+    def normalize(self):
+        """Returns these rotations projected back onto the nearest orthogonal matrices, e.g. after many compositions."""
+        u, _, vt = np.linalg.svd(self._matrices)
+
+        return OctonionRotation(u @ vt)
+
+    def inverse(self):
+        return OctonionRotation(np.swapaxes(self._matrices, 1, 2))
+
+    def __mul__(self, other):
+        return OctonionRotation(self._matrices @ other.matrices)
+
+    def rotate(self, vectors):
+        """Rotates a single 7D Vector or a Batch of them, and returns the result in the same form."""
+        batch, single = _as_batch(vectors, 7)
+        _check_count(len(self), batch)
+
+        rotated = np.einsum('nij,nj->ni', self._matrices, batch.values) if len(self) > 1 else \
+            batch.values @ self._matrices[0].T
+
+        return batch.geometry(rotated[0]) if single else Batch(batch._template, rotated)
@@ -0,0 +1,104 @@
+import numpy as np
+from geometry.batch import Batch, _values_of
+
+_signature_error_description = \
+    'Signature mismatch. The dimensions of the objects are the same, but the attribute names are ' + \
+    'different. This error is intentionally thrown to prevent operations done on objects of the same ' + \
+    'dimensionality, but in different vector spaces or coordinate systems.'
+
+
+def _point_signature(geometry):
+    # Boxes are defined by Points, so sampling Vectors inside of one means comparing against the Vector's own Point
+    return geometry._point.signature if hasattr(geometry, '_point') else geometry.signature
+
+
+def _values(template, geometry, name) -> np.ndarray:
+    """Returns the coordinates of an optional geometry argument, after checking it against the template."""
+    if geometry is None:
+        return np.zeros(template.dimension, dtype=complex)
+
+    if _point_signature(geometry) != _point_signature(template):
+        raise TypeError(_signature_error_description + ' (argument %s)' % name)
+
+    return _values_of(geometry)
+
+
+def _store(template, samples) -> Batch:
+    # Samples are generated as float64 and written once into the complex batch storage, no per-object construction
+    values = np.empty(samples.shape, dtype=complex)
+    values.real = samples
+    values.imag = 0.0
+
+    return Batch(template, values)
+
+
+def streams(seed, count) -> list:
+    """
+    Returns count independent numpy Generators derived from a single seed.
+
+    Every stream is reproducible on its own, so each worker of a parallel job can be handed one stream and the results
+    come out the same no matter how the work is scheduled.
+    """
+    return [np.random.default_rng(child) for child in np.random.SeedSequence(seed).spawn(count)]
+
+
+def uniform_box(template, n, box=None, rng=None) -> Batch:
+    """Samples n geometries like template uniformly from inside of an AABB, or from the unit cube if box is None."""
+    rng = np.random.default_rng() if rng is None else rng
+
+    if box is None:
+        low, high = np.zeros(template.dimension), np.ones(template.dimension)
+    else:
+        if box._minimum.signature != _point_signature(template):
+            raise TypeError(_signature_error_description)
+
+        low, high = box._minimum._values.real, box._maximum._values.real
+
+    return _store(template, low + rng.random((n, template.dimension)) * (high - low))
+
+
+def sphere(template, n, radius=1.0, center=None, rng=None) -> Batch:
+    """Samples n geometries like template uniformly from the surface of a sphere."""
+    rng = np.random.default_rng() if rng is None else rng
+    center = _values(template, center, 'center').real
+
+    # Normalized Gaussian samples are uniformly distributed over the sphere, in any number of dimensions
+    samples = rng.standard_normal((n, template.dimension))
+    samples /= np.linalg.norm(samples, axis=1)[:, np.newaxis]
+
+    return _store(template, center + radius * samples)
+
+
+def ball(template, n, radius=1.0, center=None, rng=None) -> Batch:
+    """Samples n geometries like template uniformly from the interior of a ball."""
+    rng = np.random.default_rng() if rng is None else rng
+    center = _values(template, center, 'center').real
+
+    samples = rng.standard_normal((n, template.dimension))
+    samples /= np.linalg.norm(samples, axis=1)[:, np.newaxis]
+
+    # Volume grows with r^d, so the radius has to be drawn as u^(1/d) for the points to be uniform over the ball
+    samples *= rng.random(n)[:, np.newaxis] ** (1.0 / template.dimension)
+
+    return _store(template, center + radius * samples)
+
+
+def gaussian(template, n, mean=None, std=1.0, rng=None) -> Batch:
+    """Samples n geometries like template from a normal distribution, with a per-dimension or scalar std."""
+    rng = np.random.default_rng() if rng is None else rng
+    mean = _values(template, mean, 'mean').real
+
+    return _store(template, mean + np.asarray(std, dtype=float) * rng.standard_normal((n, template.dimension)))
+
+
+def chunked(sampler, template, n, chunk_size=1000000, rng=None, **kwargs):
+    """
+    Yields Batches of at most chunk_size geometries at a time, adding up to n geometries drawn from sampler.
+
+    Only one chunk is held in memory at once. All chunks are drawn from the same Generator, so a given seed and
+    chunk_size always produce the same sequence of Batches.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+
+    for start in range(0, n, chunk_size):
+        yield sampler(template, min(chunk_size, n - start), rng=rng, **kwargs)
@@ -0,0 +1,150 @@
+import numpy as np
+from geometry.batch import Batch, template
+
+_layout_error_description = \
+    'Named attributes always come after unnamed ones in a geometry, so a view can\'t place unnamed dimension(s) %s ' + \
+    'after named ones.'
+
+_copy_error_description = \
+    'The dimensions %s are not evenly spaced in the underlying array, so there is no way to view them without ' + \
+    'copying. Pass copy=True to allow a copy.'
+
+
+def _point_of(geometry):
+    if isinstance(geometry, Batch):
+        geometry = geometry._template
+
+    return geometry._point if hasattr(geometry, '_point') else geometry
+
+
+def _is_vector(geometry):
+    if isinstance(geometry, Batch):
+        geometry = geometry._template
+
+    return hasattr(geometry, '_point')
+
+
+def _names(geometry) -> dict:
+    """Maps every dimension that has a name to that name, following the layout Point gives to keyword arguments."""
+    point = _point_of(geometry)
+    names = dir(point)
+
+    return {point.dimension - len(names) + i: name for i, name in enumerate(names)}
+
+
+def _values(geometry) -> np.ndarray:
+    if isinstance(geometry, Batch):
+        return geometry.values
+
+    return _point_of(geometry)._values
+
+
+def _view(geometry, values, names):
+    """Wraps values (which should share memory with geometry) up with a new signature, without copying them."""
+    new_template = template(values.shape[-1], names, _is_vector(geometry))
+
+    if isinstance(geometry, Batch):
+        return Batch(new_template, values)
+
+    _point_of(new_template)._values = values
+
+    return new_template
+
+
+def _strided(indices):
+    """Returns a slice that picks out exactly indices from an array, or None if indices aren't evenly spaced."""
+    if len(indices) == 1:
+        return slice(indices[0], indices[0] + 1)
+
+    step = indices[1] - indices[0]
+
+    if step == 0 or np.any(np.diff(indices) != step):
+        return None
+
+    stop = indices[-1] + step
+
+    return slice(indices[0], stop if stop >= 0 else None, step)
+
+
+def _indices(geometry, attributes):
+    dimension = _point_of(geometry).dimension
+    lookup = {name: index for index, name in _names(geometry).items()}
+    indices = []
+
+    for attribute in attributes:
+        if isinstance(attribute, str):
+            if attribute not in lookup:
+                raise AttributeError('%s has no attribute %s.' % (str(type(_point_of(geometry))), attribute))
+            indices.append(lookup[attribute])
+        else:
+            # Same bounds as numpy indexing, since an index outside of them would silently shrink the view
+            if attribute < -dimension or attribute >= dimension:
+                raise IndexError('index %i is out of bounds for a geometry of dimension %i' % (attribute, dimension))
+            indices.append(attribute + dimension if attribute < 0 else attribute)
+
+    return indices
+
+
+def rename(geometry, names):
+    """
+    Returns a view of a Point, Vector or Batch under new attribute names, sharing the same underlying values.
+
+    names is either a mapping from old names to new ones, or a tuple of new names, which are given to the last
+    len(names) dimensions the same way Point treats keyword arguments. The view has the signature that goes with its new
+    names, so it's checked against other geometry as a member of that coordinate system from then on.
+    """
+    current = _names(geometry)
+
+    if isinstance(names, dict):
+        unknown = set(names) - set(current.values())
+        if len(unknown) > 0:
+            raise AttributeError('%s has no attribute(s) %s.' % (str(type(_point_of(geometry))), sorted(unknown)))
+
+        names = tuple(names.get(name, name) for index, name in sorted(current.items()))
+
+    if len(names) > _point_of(geometry).dimension or len(set(names)) != len(names):
+        raise ValueError('A geometry needs one distinct name per named dimension, got %s.' % str(names))
+
+    return _view(geometry, _values(geometry), tuple(names))
+
+
+def select(geometry, attributes, copy=False):
+    """
+    Returns a view of some of the dimensions of a Point, Vector or Batch, in the given order.
+
+    attributes can be attribute names or dimension indices, and the selected dimensions keep their names. Selections
+    that are evenly spaced in the underlying array (e.g. (x, y) out of (x, y, z), or (z, y, x)) are views that share
+    memory with the original. Anything else needs a copy, which has to be asked for explicitly with copy=True.
+    """
+    indices = _indices(geometry, attributes)
+    names = _names(geometry)
+
+    # A dimension can only appear once, otherwise the result would have more values than its names and signature say
+    if len(set(indices)) != len(indices):
+        raise ValueError('%s selects the same dimension more than once.' % str(attributes))
+
+    selected_names = [names.get(index) for index in indices]
+    unnamed = [i for i, name in enumerate(selected_names) if name is None]
+
+    if len(unnamed) > 0 and unnamed[-1] >= len(unnamed):
+        raise ValueError(_layout_error_description % str([indices[i] for i in unnamed]))
+
+    key = _strided(indices)
+
+    if key is None and not copy:
+        raise ValueError(_copy_error_description % str(indices))
+
+    key = key if key is not None else indices
+    values = _values(geometry)[:, key] if isinstance(geometry, Batch) else _values(geometry)[key]
+
+    return _view(geometry, values, tuple(name for name in selected_names if name is not None))
+
+
+def permute(geometry, order, copy=False):
+    """Returns a view of a Point, Vector or Batch with all of its dimensions reordered. See select()."""
+    indices = _indices(geometry, order)
+
+    if sorted(indices) != list(range(0, _point_of(geometry).dimension)):
+        raise ValueError('%s is not a permutation of the dimensions of %s.' % (str(order), str(type(geometry))))
+
+    return select(geometry, order, copy)
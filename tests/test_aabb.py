@@ -0,0 +1,87 @@
+import numpy as np
+from geometry.base import AABB, Point
+from geometry.batch import Batch
+from geometry.functions import aabb
+
+
+def test_aabb_initialization():
+    box = AABB(Point(0, 0, 0), Point(1, 1, 1))
+
+    assert (str(type(box))) == "<class 'geometry.base.3D AABB'>"
+    assert box.dimension == 3
+    assert box.minimum == Point(0, 0, 0)
+
+    caught_exception = None
+
+    try:
+        AABB(Point(1, 1), Point(0, 0))
+    except ValueError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+    caught_exception = None
+
+    try:
+        AABB(Point(0, 0), Point(x=1, y=1))
+    except TypeError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+
+def test_signature():
+    x = AABB(Point(0, 0), Point(1, 1))
+    y = AABB(Point(x=0, y=0), Point(x=1, y=1))
+    z = AABB(Point(2, 2), Point(3, 3))
+
+    assert x.signature != y.signature
+    assert x.signature == z.signature
+
+
+def test_contains():
+    box = AABB(Point(x=0, y=0), Point(x=2, y=1))
+
+    assert Point(x=1, y=1) in box
+    assert Point(x=3, y=0) not in box
+    assert aabb.contains(box, Point(x=1, y=0.5))
+
+    points = Batch(Point(x=0, y=0), [[1, 1], [3, 0], [-1, 0], [0, 0]])
+
+    assert list(aabb.contains(box, points)) == [True, False, False, True]
+
+    caught_exception = None
+
+    try:
+        aabb.contains(box, Batch(Point(0, 0), [[1, 1]]))
+    except TypeError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+
+def test_intersection_and_union():
+    a = AABB(Point(0, 0), Point(2, 2))
+    b = AABB(Point(1, 1), Point(3, 4))
+    c = AABB(Point(5, 5), Point(6, 6))
+
+    assert aabb.intersects(a, b)
+    assert not aabb.intersects(a, c)
+
+    assert aabb.intersection(a, b) == AABB(Point(1, 1), Point(2, 2))
+    assert aabb.intersection(a, c) is None
+
+    assert aabb.union(a, c) == AABB(Point(0, 0), Point(6, 6))
+
+
+def test_query():
+    boxes = [AABB(Point(0, 0), Point(1, 1)), AABB(Point(0.5, 0.5), Point(2, 2)), AABB(Point(5, 5), Point(6, 6))]
+    points = Batch(Point(0, 0), [[0.25, 0.25], [0.75, 0.75], [1.5, 1.5]])
+
+    indices = aabb.query(boxes, points, block_size=2)
+
+    assert list(indices[0]) == [0, 1]
+    assert list(indices[1]) == [1, 2]
+    assert list(indices[2]) == []
+
+    assert np.array_equal(indices[0], np.flatnonzero(aabb.contains(boxes[0], points)))
@@ -0,0 +1,116 @@
+import numpy as np
+from geometry.base import Point, SparseVector, Vector
+from geometry.batch import Batch
+
+
+def test_batch_from_geometries():
+    b = Batch.from_geometries([Point(x=1, y=2), Point(x=3, y=4)])
+
+    assert len(b) == 2
+    assert b.dimension == 2
+    assert b.signature == Point(x=0, y=0).signature
+
+    assert b[1] == Point(x=3, y=4)
+    assert b[1].y == 4
+
+
+def test_batch_signature_mismatch():
+    caught_exception = None
+
+    try:
+        Batch.from_geometries([Point(x=1, y=2), Point(1, 2)])
+    except TypeError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+
+def test_batch_from_array():
+    b = Batch(Vector(x=0, y=0, z=0), np.arange(9).reshape(3, 3))
+
+    assert b[2] == Vector(x=6, y=7, z=8)
+    assert len(b[1:]) == 2
+    assert [v.x for v in b] == [0, 3, 6]
+
+    caught_exception = None
+
+    try:
+        Batch(Vector(x=0, y=0, z=0), np.zeros((3, 2)))
+    except ValueError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+
+def test_batch_setitem():
+    b = Batch(Point(x=0, y=0), np.zeros((2, 2)))
+
+    b[0] = Point(x=5, y=6)
+
+    assert b[0] == Point(x=5, y=6)
+
+    caught_exception = None
+
+    try:
+        b[1] = Point(5, 6)
+    except TypeError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+
+def test_batch_vector_broadcasting():
+    b = Batch(Vector(x=0, y=0), np.arange(6).reshape(3, 2))
+    offset = Vector(x=1, y=10)
+
+    assert list((b + offset).values[:, 1]) == [11, 13, 15]
+    assert list((offset + b).values[:, 1]) == [11, 13, 15]
+    assert list((offset - b).values[:, 0]) == [1, -1, -3]
+    assert list((b + SparseVector([1], [10], names=('x', 'y'))).values[:, 1]) == [11, 13, 15]
+
+    caught_exception = None
+
+    try:
+        b + Vector(1, 10)
+    except TypeError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+
+def test_batch_scalar_broadcasting():
+    b = Batch(Vector(x=0, y=0), np.arange(6).reshape(3, 2))
+    weights = np.array([1, 2, 3])
+
+    assert list((b * weights).values[:, 1]) == [1, 6, 15]
+    assert list((weights * b).values[:, 1]) == [1, 6, 15]
+    assert list((b / 2).values[:, 1]) == [0.5, 1.5, 2.5]
+    assert list((Vector(x=1, y=2) * weights).values[:, 1]) == [2, 4, 6]
+    assert list((-b).values[:, 0]) == [0, -2, -4]
+
+    caught_exception = None
+
+    try:
+        b * np.array([1, 2])
+    except ValueError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+    caught_exception = None
+
+    try:
+        b * Vector(x=1, y=2)
+    except TypeError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+    caught_exception = None
+
+    try:
+        Batch(Point(x=0, y=0), np.zeros((2, 2))) + 1
+    except TypeError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
@@ -0,0 +1,76 @@
+import numpy as np
+from geometry.base import Vector
+from geometry.batch import Batch
+from geometry import clustering
+
+
+def _blobs(rng, n=300):
+    centres = np.array([[0.0, 0.0], [10.0, 0.0], [0.0, 10.0]])
+    labels = rng.integers(0, 3, n)
+
+    return Batch(Vector(x=0, y=0), centres[labels] + rng.standard_normal((n, 2)) * 0.5), centres
+
+
+def _matches(found, centres):
+    return all(np.min(np.linalg.norm(found - c, axis=1)) < 0.5 for c in centres)
+
+
+def test_kmeans_plusplus():
+    vectors, _ = _blobs(np.random.default_rng(0))
+    seeds = clustering.kmeans_plusplus(vectors, 3, rng=np.random.default_rng(1))
+
+    assert len(seeds) == 3
+    assert seeds.signature == vectors.signature
+
+
+def test_kmeans():
+    vectors, centres = _blobs(np.random.default_rng(2))
+
+    for n_jobs in (1, 2):
+        centroids, labels, inertia = clustering.kmeans(vectors, 3, rng=np.random.default_rng(3), block_size=64,
+                                                       n_jobs=n_jobs)
+
+        assert centroids.signature == vectors.signature
+        assert _matches(centroids.values.real, centres)
+        assert len(set(labels)) == 3
+        assert inertia < 300
+
+    caught_exception = None
+
+    try:
+        clustering.kmeans(vectors[:2], 3)
+    except ValueError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+    caught_exception = None
+
+    try:
+        clustering.kmeans(vectors, 0)
+    except ValueError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+
+def test_mini_batch_kmeans():
+    rng = np.random.default_rng(4)
+    model = clustering.MiniBatchKMeans(3, rng=np.random.default_rng(5))
+
+    for _ in range(10):
+        vectors, centres = _blobs(rng, 100)
+        model.partial_fit(vectors)
+
+    assert _matches(model.centroids.values.real, centres)
+    assert model.centroids[0].signature == Vector(x=0, y=0).signature
+    assert len(model.predict(vectors)) == 100
+
+    caught_exception = None
+
+    try:
+        model.partial_fit(Batch(Vector(0, 0), [[1, 1]]))
+    except TypeError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
@@ -0,0 +1,60 @@
+import numpy as np
+from geometry.base import Point
+from geometry.batch import Batch
+from geometry import curves
+
+
+def test_morton_keys():
+    grid = Batch(Point(0, 0), [[0, 0], [0, 1], [1, 0], [1, 1]])
+
+    assert list(curves.keys(grid, 'morton', bits=1)) == [0, 1, 2, 3]
+
+    line = np.array([[0.0], [0.5], [1.0]])
+
+    assert list(curves.keys(line, 'morton', bits=53)) == [0, 2 ** 52, 2 ** 53 - 1]
+
+    caught_exception = None
+
+    try:
+        curves.keys(line, 'morton', bits=64)
+    except ValueError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+
+def test_hilbert_keys():
+    # Every step along a Hilbert curve moves to an adjacent cell, in any number of dimensions
+    for dimension in (2, 3):
+        cells = np.stack(np.meshgrid(*[np.arange(4)] * dimension, indexing='ij'), axis=-1).reshape(-1, dimension)
+        grid = Batch(Point(*([0] * dimension)), cells)
+
+        hilbert = curves.keys(grid, 'hilbert', bits=2)
+
+        assert sorted(hilbert) == list(range(4 ** dimension))
+
+        path = cells[np.argsort(hilbert)]
+
+        assert np.all(np.abs(np.diff(path, axis=0)).sum(axis=1) == 1)
+
+
+def test_reorder_and_restore():
+    points = Batch(Point(x=0, y=0), np.random.default_rng(0).random((100, 2)))
+
+    reordered, permutation = curves.reorder(points)
+
+    assert reordered.signature == points.signature
+    assert np.array_equal(reordered.values, points.values[permutation])
+    assert np.array_equal(curves.restore(reordered, permutation).values, points.values)
+    assert np.array_equal(curves.restore(reordered.values[:, 0], permutation), points.values[:, 0])
+
+
+def test_reorder_array(tmp_path):
+    values = np.lib.format.open_memmap(tmp_path / 'in.npy', mode='w+', dtype=float, shape=(50, 3))
+    values[:] = np.random.default_rng(1).random((50, 3))
+    out = np.lib.format.open_memmap(tmp_path / 'out.npy', mode='w+', dtype=float, shape=(50, 3))
+
+    permutation = curves.reorder_array(values, out, curve='morton', chunk_size=7)
+
+    assert np.array_equal(out, values[permutation])
+    assert np.array_equal(permutation, np.argsort(curves.keys(np.asarray(values), 'morton'), kind='stable'))
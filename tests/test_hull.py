@@ -0,0 +1,77 @@
+import numpy as np
+from geometry.base import AABB, Point
+from geometry.batch import Batch
+from geometry.hull import IncrementalHull, bounding_box, bounding_sphere, convex_hull
+
+
+def test_convex_hull_2d():
+    square = Batch(Point(x=0, y=0), [[0, 0], [1, 0], [1, 1], [0, 1], [0.5, 0.5], [0.5, 0], [0.2, 0.7]])
+    vertices, indices = convex_hull(square)
+
+    assert vertices.signature == square.signature
+    assert list(indices) == [0, 1, 2, 3]
+
+    caught_exception = None
+
+    try:
+        convex_hull(Batch(Point(0, 0), [[0, 0], [1, 1], [2, 2]]))
+    except ValueError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+
+def test_convex_hull_3d():
+    rng = np.random.default_rng(0)
+    corners = np.array([[x, y, z] for x in (0, 1) for y in (0, 1) for z in (0, 1)], dtype=float)
+    cloud = Batch(Point(0, 0, 0), np.concatenate([rng.random((200, 3)), corners]))
+
+    vertices, indices, faces = convex_hull(cloud)
+
+    assert sorted(indices) == list(range(200, 208))
+    assert len(faces) == 12
+
+    # Every hull face has all of the points on its inner side
+    normals = np.cross(vertices.values.real[faces[:, 1]] - vertices.values.real[faces[:, 0]],
+                       vertices.values.real[faces[:, 2]] - vertices.values.real[faces[:, 0]])
+    offsets = np.sum(normals * vertices.values.real[faces[:, 0]], axis=1)
+
+    assert np.all(cloud.values.real @ normals.T - offsets <= 1e-9)
+
+
+def test_incremental_hull():
+    rng = np.random.default_rng(1)
+    points = rng.standard_normal((300, 3))
+    hull = IncrementalHull(Point(0, 0, 0))
+
+    for chunk in np.split(points, 10):
+        hull.update(Batch(Point(0, 0, 0), chunk))
+
+    _, indices, _ = convex_hull(Batch(Point(0, 0, 0), points))
+
+    assert sorted(map(tuple, np.round(hull.vertices.values.real, 8))) == \
+        sorted(map(tuple, np.round(points[indices], 8)))
+
+
+def test_bounding_box():
+    points = Batch(Point(x=0, y=0), [[1, 5], [-2, 3], [0, 7]])
+
+    assert bounding_box(points) == AABB(Point(x=-2, y=3), Point(x=1, y=7))
+
+
+def test_bounding_sphere():
+    rng = np.random.default_rng(2)
+    points = Batch(Point(*([0] * 4)), rng.standard_normal((500, 4)))
+
+    center, radius = bounding_sphere(points, rng=np.random.default_rng(3))
+    ritter_center, ritter_radius = bounding_sphere(points, method='ritter')
+
+    assert center.signature == points.signature
+    assert np.all(np.linalg.norm(points.values - center._values, axis=1) <= radius + 1e-9)
+    assert np.all(np.linalg.norm(points.values - ritter_center._values, axis=1) <= ritter_radius + 1e-9)
+    assert radius <= ritter_radius + 1e-9
+
+    center, radius = bounding_sphere([Point(0, 0), Point(2, 0), Point(1, 0.5)])
+
+    assert center == Point(1, 0)
+    assert np.isclose(radius, 1.0)
@@ -0,0 +1,89 @@
+import numpy as np
+from geometry.base import Vector
+from geometry.batch import Batch
+from geometry.functions import interpolation, vector
+
+
+def test_lerp():
+    a = Vector(x=0, y=0)
+    b = Vector(x=2, y=4)
+
+    result = interpolation.lerp([a, b], [0.0, 0.25, 1.0])
+
+    assert len(result) == 3
+    assert result.signature == a.signature
+    assert result[1] == a + (b - a) * 0.25
+    assert result[2] == b
+
+    keyframes = Batch(Vector(0, 0), [[0, 0], [1, 0], [1, 1]])
+    result = interpolation.lerp(keyframes, [10, 25], times=[0, 20, 30])
+
+    assert result[0] == Vector(0.5, 0)
+    assert result[1] == Vector(1, 0.5)
+
+
+def test_slerp():
+    a = Vector(1.0, 0.0, 0.0)
+    b = Vector(0.0, 1.0, 0.0)
+
+    result = interpolation.slerp([a, b], np.linspace(0, 1, 5))
+
+    assert result[0] == a
+    assert result[4] == b
+    assert np.isclose(vector.angle(a, result[1]), np.deg2rad(22.5))
+    assert np.isclose(result[2].norm(), 1.0)
+
+    parallel = interpolation.slerp([a, a * 3], [0.5])
+
+    assert parallel[0] == a * 2
+
+    caught_exception = None
+
+    try:
+        interpolation.slerp([a, Vector(0, 0, 0)], [0.5])
+    except ZeroDivisionError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+    caught_exception = None
+
+    try:
+        interpolation.slerp([a, -a], [0.5])
+    except ValueError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+
+def test_catmull_rom():
+    keyframes = Batch(Vector(0), [[0], [1], [4], [9]])
+
+    result = interpolation.catmull_rom(keyframes, [0, 1, 2, 3, 1.5])
+
+    assert np.allclose(result.values[:4, 0], [0, 1, 4, 9])
+    assert np.isclose(result.values[4, 0], 2.25)
+
+    line = interpolation.catmull_rom([Vector(0, 0), Vector(1, 2), Vector(2, 4)], np.linspace(0, 2, 9))
+
+    assert np.allclose(line.values[:, 1], 2 * line.values[:, 0])
+
+
+def test_keyframe_checks():
+    caught_exception = None
+
+    try:
+        interpolation.lerp([Vector(0, 0), Vector(1, 1)], [0.5], times=[1, 0])
+    except ValueError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+    caught_exception = None
+
+    try:
+        interpolation.lerp([Vector(0, 0), Vector(x=1, y=1)], [0.5])
+    except TypeError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
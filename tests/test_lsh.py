@@ -0,0 +1,102 @@
+import numpy as np
+from geometry.base import Point, Vector
+from geometry.batch import Batch
+from geometry.lsh import LSHIndex
+
+
+def _clustered_batch(template, rng, n=200):
+    centres = rng.standard_normal((4, template.dimension)) * 10.0
+    return Batch(template, centres[rng.integers(0, 4, n)] + rng.standard_normal((n, template.dimension)) * 0.1)
+
+
+def test_angle_query():
+    rng = np.random.default_rng(0)
+    template = Vector(*([0] * 32))
+    points = _clustered_batch(template, rng)
+
+    index = LSHIndex(template, n_tables=8, n_bits=8, seed=1)
+    assert list(index.add(points)) == list(range(200))
+    assert len(index) == 200
+
+    indices, distances = index.query(points[:10], k=3)
+
+    assert indices.shape == (10, 3)
+    assert list(indices[:, 0]) == list(range(10))
+    assert np.allclose(distances[:, 0], 0.0, atol=1e-6)
+
+
+def test_euclidean_query():
+    rng = np.random.default_rng(0)
+    template = Point(*([0] * 16))
+    points = _clustered_batch(template, rng)
+
+    index = LSHIndex(template, n_tables=6, n_bits=4, metric='euclidean', bucket_width=8.0, seed=2)
+    index.add(points[:100])
+    index.add(points[100:])
+
+    indices, distances = index.query(points[150], k=1)
+
+    assert indices[0, 0] == 150
+    assert index[150] == points[150]
+
+
+def test_batch_query_is_exact_within_buckets():
+    rng = np.random.default_rng(5)
+    template = Point(*([0] * 8))
+    points = Batch(template, rng.standard_normal((300, 8)))
+    queries = Batch(template, rng.standard_normal((40, 8)))
+
+    # Buckets this wide hold everything, so every query is re-ranked against every point and the result is exact
+    index = LSHIndex(template, n_tables=2, n_bits=2, metric='euclidean', bucket_width=1e6, seed=6)
+
+    for start in range(0, 300, 7):
+        index.add(points[start:start + 7])
+
+    indices, distances = index.query(queries, k=4, block_size=16)
+
+    exact = np.sqrt(np.sum(np.abs(queries.values[:, np.newaxis, :] - points.values[np.newaxis, :, :]) ** 2, axis=2))
+
+    assert np.array_equal(indices, np.argsort(exact, axis=1, kind='stable')[:, :4])
+    assert np.allclose(distances, np.sort(exact, axis=1)[:, :4])
+
+    padded, padded_distances = LSHIndex(template, seed=0).query(queries[:2], k=2)
+
+    assert np.all(padded == -1) and np.all(np.isinf(padded_distances))
+
+
+def test_signature_check():
+    index = LSHIndex(Vector(x=0, y=0), seed=0)
+
+    caught_exception = None
+
+    try:
+        index.add(Vector(1, 2))
+    except TypeError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+
+def test_save_and_load(tmp_path):
+    rng = np.random.default_rng(3)
+    template = Vector(x=0, y=0, z=0)
+    points = Batch(template, rng.standard_normal((50, 3)))
+
+    index = LSHIndex(template, n_tables=4, n_bits=6, seed=4)
+    index.add(points)
+    index.save(tmp_path / 'index.npz')
+
+    loaded = LSHIndex.load(tmp_path / 'index.npz')
+
+    assert len(loaded) == 50
+    assert loaded[0].y == points[0].y
+
+    expected = index.query(points[:5], k=2)
+    actual = loaded.query(Batch(Vector(x=0, y=0, z=0), points.values[:5]), k=2)
+
+    assert np.array_equal(expected[0], actual[0])
+
+    # np.savez adds the .npz extension by itself, load has to find the file under the same name
+    index.save(tmp_path / 'bare')
+
+    assert len(LSHIndex.load(tmp_path / 'bare')) == 50
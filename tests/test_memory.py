@@ -0,0 +1,47 @@
+import numpy as np
+from geometry.base import Point, Vector
+from geometry.batch import Batch
+from geometry import memory
+
+
+def test_deep_size_point():
+    size = memory.deep_size(Point(1, 2, 3))
+
+    assert size['total'] == sum(size[c] for c in ('instance', '__dict__', 'class', 'closures', 'wrapped', 'arrays',
+                                                   'other'))
+    assert size['arrays'] >= 3 * 16
+    assert size['class'] > 0
+    assert size['closures'] > 0
+    assert size['wrapped'] == 0
+
+
+def test_deep_size_vector():
+    size = memory.deep_size(Vector(x=1, y=2, z=3))
+
+    assert size['wrapped'] > 0
+    assert size['total'] > memory.deep_size(Point(x=1, y=2, z=3))['total']
+
+
+def test_deep_size_collections():
+    vectors = [Vector(1, 2, 3) for _ in range(10)]
+    single = memory.deep_size(vectors[0])['total']
+
+    assert memory.deep_size(vectors)['total'] > 5 * single
+
+    # Shared objects are only counted once
+    assert memory.deep_size([vectors[0]] * 10)['total'] < 2 * single
+
+    batch = Batch(Vector(0, 0, 0), np.zeros((1000, 3)))
+
+    assert memory.deep_size(batch)['arrays'] >= 1000 * 3 * 16
+    assert memory.deep_size(batch)['total'] < memory.deep_size(list(batch[:100]))['total']
+
+
+def test_track():
+    with memory.track() as tracker:
+        vectors = [Vector(1, 2, 3) for _ in range(50)]
+        sums = [v + v for v in vectors]
+
+    assert tracker.report['construction']['bytes'] > 0
+    assert tracker.report['arithmetic']['bytes'] > 0
+    assert len(sums) == 50
@@ -0,0 +1,75 @@
+import asyncio
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from geometry.base import Point, Vector
+from geometry.batch import Batch
+from geometry.pipeline import Filter, Map, Pipeline, Reduce
+
+
+def _batches(count=5, size=10):
+    return [Batch(Point(x=0, y=0), np.arange(2 * size).reshape(size, 2) + i * 100) for i in range(count)]
+
+
+def test_pipeline_stages():
+    def shift(batch):
+        return Batch(batch.template, batch.values + 1)
+
+    def small_x(batch):
+        return batch.values[:, 0].real < 210
+
+    def count(total, batch):
+        return total + len(batch)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pipeline = Pipeline(Map(shift, offload=True, executor=executor), Filter(small_x), Reduce(count, 0), maxsize=1)
+        results = asyncio.run(pipeline.run(_batches()))
+
+    assert results == [25]
+
+    metrics = pipeline.metrics
+
+    assert metrics['shift']['batches'] == 5
+    assert metrics['shift']['items'] == 50
+    assert metrics['small_x']['batches'] == 5
+    assert metrics['count']['items'] == 25
+    assert metrics['shift']['max_latency'] >= metrics['shift']['mean_latency'] >= 0.0
+
+
+def test_pipeline_async_source():
+    async def source():
+        for batch in _batches(3):
+            await asyncio.sleep(0)
+            yield batch
+
+    async def collect():
+        return [batch async for batch in Pipeline(Map(lambda b: b[:2], name='head')).stream(source())]
+
+    results = asyncio.run(collect())
+
+    assert [len(batch) for batch in results] == [2, 2, 2]
+    assert results[1][0] == Point(x=100, y=101)
+
+
+def test_pipeline_signature_check():
+    batches = _batches(2) + [Batch(Vector(x=0, y=0), [[1, 2]])]
+
+    caught_exception = None
+
+    try:
+        asyncio.run(Pipeline(Map(lambda b: b, name='identity')).run(batches))
+    except TypeError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+
+def test_pipeline_rerun():
+    pipeline = Pipeline(Reduce(lambda total, batch: total + len(batch), 0, name='count'))
+
+    assert asyncio.run(pipeline.run(_batches(3))) == [30]
+    assert asyncio.run(pipeline.run(_batches(3))) == [30]
+
+    # A new run may use a different signature than the last one
+    other = [Batch(Point(0, 0), np.zeros((4, 2)))]
+
+    assert asyncio.run(pipeline.run(other)) == [4]
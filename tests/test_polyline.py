@@ -0,0 +1,88 @@
+import numpy as np
+from geometry.base import Point, Polyline
+from geometry.batch import Batch
+from geometry.functions import polyline
+
+
+def test_polyline_initialization():
+    line = Polyline([Point(x=0, y=0), Point(x=3, y=4), Point(x=3, y=10)])
+
+    assert (str(type(line))) == "<class 'geometry.base.2D Polyline'>"
+    assert len(line) == 3
+    assert line.dimension == 2
+    assert line[1] == Point(x=3, y=4)
+
+    caught_exception = None
+
+    try:
+        Polyline([Point(0, 0)])
+    except TypeError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+
+def test_signature():
+    assert Polyline([Point(0, 0), Point(1, 1)]).signature == Polyline([Point(2, 2), Point(3, 3)]).signature
+    assert Polyline([Point(0, 0), Point(1, 1)]).signature != Polyline([Point(x=0, y=0), Point(x=1, y=1)]).signature
+
+
+def test_lengths():
+    line = Polyline([Point(0, 0), Point(3, 4), Point(3, 10)])
+
+    assert np.allclose(polyline.segment_lengths(line), [5, 6])
+    assert np.allclose(polyline.arc_length(line), [0, 5, 11])
+    assert polyline.length(line) == 11.0
+
+
+def test_resample():
+    line = Polyline([Point(0, 0), Point(4, 0), Point(4, 4)])
+    resampled = polyline.resample(line, 5)
+
+    assert resampled == Polyline(Batch(Point(0, 0), [[0, 0], [2, 0], [4, 0], [4, 2], [4, 4]]))
+
+
+def test_simplify():
+    line = Polyline(Batch(Point(0, 0), [[0, 0], [1, 0.05], [2, -0.05], [3, 0], [3, 1], [3, 2]]))
+
+    assert polyline.simplify(line, 0.1) == Polyline([Point(0, 0), Point(3, 0), Point(3, 2)])
+    assert len(polyline.simplify(line, 0.01)) == 5
+
+
+def test_closest_point():
+    line = Polyline([Point(0, 0), Point(4, 0), Point(4, 4)])
+    queries = Batch(Point(0, 0), [[1, 1], [5, 2], [-1, -1]])
+
+    closest, segments, along, distances = polyline.closest_point(line, queries, block_size=2)
+
+    assert np.allclose(closest.values, [[1, 0], [4, 2], [0, 0]])
+    assert list(segments) == [0, 1, 0]
+    assert np.allclose(along, [1, 6, 0])
+    assert np.allclose(distances, [1, 1, np.sqrt(2)])
+
+    point, segment, _, _ = polyline.closest_point(line, Point(2, -3))
+
+    assert point == Point(2, 0)
+    assert segment == 0
+
+
+def test_closest_point_long_path():
+    import tracemalloc
+
+    # 20k vertices along the x axis, with every query one unit above it
+    line = Polyline(Batch(Point(0, 0), np.column_stack([np.arange(20001), np.zeros(20001)])))
+    x = np.linspace(0, 20000, 1000)
+    queries = Batch(Point(0, 0), np.column_stack([x, np.ones(1000)]))
+
+    tracemalloc.start()
+    closest, segments, along, distances = polyline.closest_point(line, queries)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    assert np.allclose(closest.values.real[:, 0], x)
+    assert np.allclose(along, x)
+    assert np.allclose(distances, 1)
+    assert np.all(segments <= 19999)
+
+    # Comparing every query against every segment at once would take several hundred MB
+    assert peak < 100 * 2 ** 20
@@ -0,0 +1,87 @@
+import numpy as np
+from geometry.base import Vector
+from geometry.batch import Batch
+from geometry.functions import vector
+from geometry.rotation import OctonionRotation, Quaternion, octonion_multiply
+
+
+def test_quaternion_rotate():
+    quarter_turn = Quaternion.from_axis_angle(Vector(0, 0, 1), np.pi / 2)
+
+    assert quarter_turn.rotate(Vector(x=1, y=0, z=0)) == Vector(x=0, y=1, z=0)
+
+    vectors = Batch(Vector(0, 0, 0), np.random.default_rng(0).standard_normal((100, 3)))
+    rotated = quarter_turn.rotate(vectors)
+
+    assert rotated.signature == vectors.signature
+    assert np.allclose(rotated.values, vectors.values @ quarter_turn.matrix()[0].T)
+    assert np.allclose(np.linalg.norm(rotated.values, axis=1), np.linalg.norm(vectors.values, axis=1))
+
+
+def test_quaternion_batches():
+    axes = Batch(Vector(0, 0, 0), [[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+    rotations = Quaternion.from_axis_angle(axes, [np.pi, np.pi, np.pi])
+    vectors = Batch(Vector(0, 0, 0), [[0, 1, 0], [1, 0, 0], [1, 1, 1]])
+
+    assert np.allclose(rotations.rotate(vectors).values, [[0, -1, 0], [-1, 0, 0], [-1, -1, 1]])
+
+    caught_exception = None
+
+    try:
+        rotations.rotate(vectors[:2])
+    except ValueError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+    caught_exception = None
+
+    try:
+        Quaternion.from_axis_angle(Vector(0, 0, 0), np.pi)
+    except ZeroDivisionError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+
+def test_quaternion_composition():
+    a = Quaternion.from_axis_angle(Vector(1, 0, 0), 0.3)
+    b = Quaternion.from_axis_angle(Vector(0, 1, 0), 1.1)
+    v = Vector(1.0, 2.0, 3.0)
+
+    assert (a * b).rotate(v) == a.rotate(b.rotate(v))
+    assert (a * a.inverse()).rotate(v) == v
+    assert np.allclose((a * b).matrix(), a.matrix() @ b.matrix())
+
+    drifted = Quaternion(a.values * 1.5)
+
+    assert np.allclose(np.linalg.norm(drifted.normalize().values, axis=1), 1.0)
+
+
+def test_octonion_product_matches_cross():
+    a = Vector(1, 2, 3, 4, 5, 6, 7)
+    b = Vector(8, 9, 10, 11, 12, 13, 14)
+
+    product = octonion_multiply(np.concatenate([[0], a._point._values.real]),
+                                np.concatenate([[0], b._point._values.real]))
+
+    assert np.isclose(product[0], -vector.inner(a, b))
+    assert np.allclose(product[1:], vector.cross(a, b)._point._values)
+
+
+def test_octonion_rotation():
+    rng = np.random.default_rng(1)
+    rotations = OctonionRotation.from_octonions(rng.standard_normal((4, 8)))
+
+    assert np.allclose(rotations.matrices @ np.swapaxes(rotations.matrices, 1, 2), np.eye(7))
+    assert np.allclose(np.linalg.det(rotations.matrices), 1.0)
+
+    vectors = Batch(Vector(*([0] * 7)), rng.standard_normal((4, 7)))
+    rotated = rotations.rotate(vectors)
+
+    assert np.allclose(np.linalg.norm(rotated.values, axis=1), np.linalg.norm(vectors.values, axis=1))
+
+    composed = rotations[0] * rotations[1]
+
+    assert composed.rotate(vectors[2]) == rotations[0].rotate(rotations[1].rotate(vectors[2]))
+    assert (composed * composed.inverse()).normalize().rotate(vectors[3]) == vectors[3]
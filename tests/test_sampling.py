@@ -0,0 +1,60 @@
+import numpy as np
+from geometry.base import AABB, Point, Vector
+from geometry.functions import aabb
+from geometry import sampling
+
+
+def test_uniform_box():
+    box = AABB(Point(x=-1, y=2), Point(x=1, y=3))
+    points = sampling.uniform_box(Point(x=0, y=0), 1000, box=box, rng=np.random.default_rng(0))
+
+    assert len(points) == 1000
+    assert points.signature == Point(x=0, y=0).signature
+    assert np.all(aabb.contains(box, points))
+
+    caught_exception = None
+
+    try:
+        sampling.uniform_box(Point(0, 0), 10, box=box)
+    except TypeError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+
+def test_sphere_and_ball():
+    rng = np.random.default_rng(1)
+    surface = sampling.sphere(Vector(0, 0, 0), 500, radius=2.0, center=Vector(1, 1, 1), rng=rng)
+    interior = sampling.ball(Vector(0, 0, 0), 500, radius=2.0, rng=rng)
+
+    assert np.allclose(np.linalg.norm(surface.values - 1, axis=1), 2.0)
+    assert np.all(np.linalg.norm(interior.values, axis=1) <= 2.0)
+
+
+def test_gaussian():
+    points = sampling.gaussian(Point(0, 0), 20000, mean=Point(5, -5), std=[1.0, 2.0], rng=np.random.default_rng(2))
+
+    assert np.allclose(points.values.real.mean(axis=0), [5, -5], atol=0.1)
+    assert np.allclose(points.values.real.std(axis=0), [1, 2], atol=0.1)
+
+
+def test_reproducibility():
+    first = sampling.gaussian(Point(0, 0), 10, rng=np.random.default_rng(3))
+    second = sampling.gaussian(Point(0, 0), 10, rng=np.random.default_rng(3))
+
+    assert np.array_equal(first.values, second.values)
+
+    streams_1 = [sampling.sphere(Point(0, 0), 5, rng=rng).values for rng in sampling.streams(4, 3)]
+    streams_2 = [sampling.sphere(Point(0, 0), 5, rng=rng).values for rng in sampling.streams(4, 3)]
+
+    assert all(np.array_equal(a, b) for a, b in zip(streams_1, streams_2))
+    assert not np.array_equal(streams_1[0], streams_1[1])
+
+
+def test_chunked():
+    chunks = list(sampling.chunked(sampling.uniform_box, Point(0, 0, 0), 25, chunk_size=10,
+                                   rng=np.random.default_rng(5)))
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert np.array_equal(np.concatenate([c.values for c in chunks]),
+                          sampling.uniform_box(Point(0, 0, 0), 25, rng=np.random.default_rng(5)).values)
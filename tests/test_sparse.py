@@ -0,0 +1,157 @@
+import numpy as np
+from geometry.base import Point, SparsePoint, SparseVector, Vector
+from geometry.batch import Batch
+from geometry.functions import interpolation, sparse, vector
+
+
+def test_sparse_initialization():
+    x = SparsePoint([0, 4], [1, 2], dimension=5)
+
+    assert (str(type(x))) == "<class 'geometry.base.5D SparsePoint'>"
+    assert x.dimension == 5
+
+    y = SparseVector([1], [3], dimension=3)
+
+    assert (str(type(y))) == "<class 'geometry.base.3D SparseVector'>"
+
+
+def test_sparse_indexing():
+    x = SparseVector([0, 4], [1, 2], dimension=5)
+
+    assert x[0] == 1
+    assert x[1] == 0
+    assert x[-1] == 2
+
+    x[1] = 7
+    x[0] = 0
+
+    assert x[1] == 7
+    assert x[0] == 0
+    assert list(x._point._indices) == [1, 4]
+
+
+def test_sparse_key_lookup():
+    x = SparseVector([2], [3], names=('x', 'y', 'z'))
+
+    assert x.z == 3
+    assert x.x == 0
+
+    x.y = 5
+
+    assert x[1] == 5
+
+
+def test_sparse_signature():
+    assert SparsePoint(names=('x', 'y', 'z')).signature == Point(x=1, y=2, z=3).signature
+    assert SparseVector(dimension=3).signature == Vector(1, 2, 3).signature
+    assert SparseVector(dimension=3).signature != Vector(x=1, y=2, z=3).signature
+
+
+def test_sparse_repr():
+    assert str(SparseVector([1, 3], [2, 4 + 3j], dimension=5)) == "<1: 2.00, 3: 4.00 + 3.00j>"
+
+
+def test_sparse_arithmetic():
+    x = SparseVector([0, 2], [1, 2], dimension=4)
+    y = SparseVector([2, 3], [-2, 5], dimension=4)
+
+    assert x + y == SparseVector([0, 3], [1, 5], dimension=4)
+    assert list((x + y)._point._indices) == [0, 3]
+    assert x * 2 == 2 * x == SparseVector([0, 2], [2, 4], dimension=4)
+    assert x / 2 == SparseVector([0, 2], [0.5, 1], dimension=4)
+    assert -x == SparseVector([0, 2], [-1, -2], dimension=4)
+
+    caught_exception = None
+
+    try:
+        x + SparseVector(names=('a', 'b', 'c', 'd'))
+    except TypeError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+
+def test_mixed_arithmetic():
+    x = SparseVector([0, 2], [1, 2], dimension=3)
+    d = Vector(1, 1, 1)
+
+    assert x + d == d + x == Vector(2, 1, 3)
+    assert d - x == Vector(0, 1, -1)
+    assert x - d == Vector(0, -1, 1)
+    assert x + 1 == Vector(2, 1, 3)
+
+
+def test_sparse_inner_product():
+    x = SparseVector([0, 2], [1, 2], dimension=3)
+    y = SparseVector([2], [3], dimension=3)
+
+    assert vector.inner(x, y) == 6.0
+    assert vector.inner(x, Vector(1, 1, 1)) == vector.inner(Vector(1, 1, 1), x) == 3.0
+    assert np.isclose(SparseVector([0, 1], [3, 4], dimension=2).norm(), 5.0)
+    assert np.isclose(vector.angle(SparseVector([0], [1], dimension=2), Vector(0, 1)), np.deg2rad(90.0))
+
+
+def test_dense_conversion():
+    d = Vector(0, 0, y=3, z=0)
+    s = sparse.from_dense(d)
+
+    assert s.signature == d.signature
+    assert list(s._point._indices) == [2]
+    assert s.to_dense() == d
+
+
+def test_shared_classes():
+    names = tuple('n%i' % i for i in range(1000))
+    x = SparseVector([0], [1], names=names)
+    y = SparseVector([5], [2], names=names)
+
+    # The class (and its name dictionary) is built once per layout, not once per instance
+    assert type(x) is type(y)
+    assert type(x._point) is type(y._point)
+    assert type(x) is not type(SparseVector([0], [1], dimension=1000))
+    assert y.n5 == 2 and x.n5 == 0
+
+
+def test_mixed_equality():
+    x = SparseVector([0, 2], [1, 2], dimension=3)
+
+    assert x == Vector(1, 0, 2)
+    assert Vector(1, 0, 2) == x
+    assert x != Vector(1, 1, 2)
+    assert SparsePoint([1], [3], names=('x', 'y')) == Point(x=0, y=3)
+    assert not Point(x=0, y=3) != SparsePoint([1], [3], names=('x', 'y'))
+    assert Point(x=0, y=1) != SparsePoint([1], [3], names=('x', 'y'))
+
+    # Equal geometry has to hash the same, or sets and dicts would hold both
+    assert hash(x) == hash(Vector(1, 0, 2))
+    assert len({x, Vector(1, 0, 2)}) == 1
+    assert hash(SparsePoint([1], [3], names=('x', 'y'))) == hash(Point(x=0, y=3))
+
+    caught_exception = None
+
+    try:
+        x == Vector(x=1, y=0, z=2)
+    except TypeError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+
+def test_sparse_in_batches():
+    x = SparseVector([0, 2], [1, 2], dimension=3)
+    b = Batch.from_geometries([x, Vector(1, 1, 1)])
+
+    assert str(type(b.template)) == "<class 'geometry.base.3D Vector'>"
+    assert b[0] == x
+    assert list(b.values[0]) == [1, 0, 2]
+    assert vector.project(x, [Vector(1, 0, 0)]) == Vector(1, 0, 0)
+    assert np.allclose(interpolation.lerp([x, Vector(0, 0, 0)], [0.5]).values, [[0.5, 0, 1]])
+
+    caught_exception = None
+
+    try:
+        Batch.from_geometries([x, Vector(x=1, y=1, z=1)])
+    except TypeError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
@@ -1,5 +1,6 @@
 import numpy as np
 from geometry.base import Point, Vector
+from geometry.batch import Batch
 from geometry.functions import vector
 
 
@@ -278,3 +279,68 @@ def test_angle():
     b = Vector(0.0, 1.0, 0.0)
 
     assert np.isclose(vector.angle(a, b), np.deg2rad(45.0))
+
+
+def test_orthonormalize():
+    vectors = Batch.from_geometries([Vector(1.0, 1.0, 0.0), Vector(1.0, 0.0, 0.0), Vector(0.0, 1.0, 1.0)])
+    frame = vector.orthonormalize(vectors)
+
+    assert len(frame) == 3
+    assert np.allclose(frame.values @ frame.values.conj().T, np.eye(3))
+    assert frame[0] == Vector(1.0, 1.0, 0.0).unit()
+
+    z = Batch.from_geometries([Vector(1j, 0), Vector(1, 1)])
+    frame = vector.orthonormalize(z)
+
+    assert np.allclose(frame.values @ frame.values.conj().T, np.eye(2))
+
+    caught_exception = None
+
+    try:
+        vector.orthonormalize([Vector(1, 0), Vector(2, 0)])
+    except ValueError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+    caught_exception = None
+
+    try:
+        vector.orthonormalize(Batch(Vector(0, 0)))
+    except ValueError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+
+def test_span():
+    basis = vector.span([Vector(1, 0, 0), Vector(2, 0, 0), Vector(0, 1, 0)])
+
+    assert len(basis) == 2
+
+
+def test_project_and_reject():
+    basis = [Vector(x=1, y=0, z=0), Vector(x=1, y=1, z=0)]
+
+    assert vector.project(Vector(x=1, y=2, z=3), basis) == Vector(x=1, y=2, z=0)
+    assert vector.reject(Vector(x=1, y=2, z=3), basis) == Vector(x=0, y=0, z=3)
+
+    vectors = Batch(Vector(x=0, y=0, z=0), np.arange(12).reshape(4, 3))
+    projected = vector.project(vectors, basis)
+    rejected = vector.reject(vectors, basis)
+
+    assert np.allclose(projected.values + rejected.values, vectors.values)
+    assert np.allclose(projected.values[:, 2], 0.0)
+
+    z = vector.project(Vector(1j, 1), [Vector(1j, 0)])
+
+    assert z == Vector(1j, 0)
+
+    caught_exception = None
+
+    try:
+        vector.project(Vector(1, 2, 3), basis)
+    except TypeError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
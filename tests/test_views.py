@@ -0,0 +1,110 @@
+import numpy as np
+from geometry.base import Point, Vector
+from geometry.batch import Batch
+from geometry import views
+
+
+def test_select():
+    p = Point(x=1, y=2, z=3)
+    xy = views.select(p, ('x', 'y'))
+
+    assert xy == Point(x=1, y=2)
+    assert xy.signature == Point(x=0, y=0).signature
+
+    xy.y = 5
+
+    assert p.y == 5
+
+    zx = views.select(p, ('z', 'x'))
+
+    assert zx == Point(z=3, x=1)
+
+    caught_exception = None
+
+    try:
+        views.select(Point(a=1, b=2, c=3, d=4), ('a', 'b', 'd'))
+    except ValueError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+    assert views.select(Point(a=1, b=2, c=3, d=4), ('a', 'b', 'd'), copy=True) == Point(a=1, b=2, d=4)
+
+
+def test_select_layout():
+    assert views.select(Point(1, 2, z=3), (1, 'z')) == Point(2, z=3)
+
+    caught_exception = None
+
+    try:
+        views.select(Point(1, 2, z=3), ('z', 0))
+    except ValueError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+    caught_exception = None
+
+    try:
+        views.select(Point(x=1, y=2, z=3), ('x', 'x'), copy=True)
+    except ValueError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+    caught_exception = None
+
+    try:
+        views.select(Point(1, 2, 3), (1, 5))
+    except IndexError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None
+
+
+def test_permute():
+    v = Vector(x=1, y=2, z=3)
+    zyx = views.permute(v, ('z', 'y', 'x'))
+
+    assert zyx == Vector(z=3, y=2, x=1)
+    assert zyx.signature != v.signature
+
+    zyx.x = 7
+
+    assert v.x == 7
+
+
+def test_rename():
+    p = Point(x=1, y=2)
+    renamed = views.rename(p, {'x': 'east', 'y': 'north'})
+
+    assert renamed == Point(east=1, north=2)
+
+    renamed.east = 4
+
+    assert p.x == 4
+    assert views.rename(Point(1, 2), ('u', 'v')) == Point(u=1, v=2)
+
+
+def test_batch_views():
+    b = Batch(Vector(x=0, y=0, z=0), np.arange(12).reshape(4, 3))
+
+    xy = views.select(b, ('x', 'y'))
+
+    assert xy.signature == Vector(x=0, y=0).signature
+    assert np.shares_memory(xy.values, b.values)
+    assert xy[1] == Vector(x=3, y=4)
+
+    renamed = views.rename(b, ('a', 'b', 'c'))
+    renamed.values[0, 0] = 10
+
+    assert b[0].x == 10
+
+    caught_exception = None
+
+    try:
+        b.check(renamed)
+    except TypeError as e:
+        caught_exception = e
+    finally:
+        assert caught_exception is not None